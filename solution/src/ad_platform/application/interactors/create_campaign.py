@@ -36,4 +36,6 @@ class CreateCampaignInteractor:
             )
             await self.campaign_service.create_campaign(campaign)
 
+        await self.campaign_service.campaigns_changed(campaign.advertiser_id)
+
         return campaign
@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterable
+
 from ad_platform.application.services.advertiser import AdvertiserService
 from ad_platform.application.services.client import ClientService
-from ad_platform.domain.entities import Score
+from ad_platform.domain.entities import BulkSummary, Score
 from ad_platform.infrastructure.db.commiter import Commiter
 
 
@@ -20,3 +22,13 @@ class CreateScoreInteractor:
             await self.advertiser_service.ensure_advertiser_exists(score.advertiser_id)
             await self.client_service.ensure_client_exists(score.client_id)
             await self.advertiser_service.upsert_score(score)
+
+
+class CreateScoresInteractor:
+    def __init__(self, advertiser_service: AdvertiserService) -> None:
+        self.advertiser_service = advertiser_service
+
+    async def __call__(self, batches: AsyncIterable[list[Score]]) -> BulkSummary:
+        # Загрузка атомарна: при ненайденных id или ошибке в данных
+        # не применяется ни один скор
+        return await self.advertiser_service.upsert_scores(batches)
@@ -28,4 +28,6 @@ class DeleteCampaignInteractor:
 
             await self.campaign_service.delete_campaign(campaign_id)
 
+        await self.campaign_service.campaigns_changed(advertiser_id)
+
         return campaign
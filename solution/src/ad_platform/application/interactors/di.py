@@ -2,8 +2,12 @@ from dishka import Provider, Scope
 
 from ad_platform.application.interactors.click_ad import ClickAdInteractor
 from ad_platform.application.interactors.create_campaign import CreateCampaignInteractor
-from ad_platform.application.interactors.create_score import CreateScoreInteractor
+from ad_platform.application.interactors.create_score import (
+    CreateScoreInteractor,
+    CreateScoresInteractor,
+)
 from ad_platform.application.interactors.delete_campaign import DeleteCampaignInteractor
+from ad_platform.application.interactors.export_events import ExportEventsInteractor
 from ad_platform.application.interactors.get_ad import GetAdInteractor
 from ad_platform.application.interactors.get_advertiser_stats import (
     GetAdvertiserDailyStatsInteractor,
@@ -11,6 +15,7 @@ from ad_platform.application.interactors.get_advertiser_stats import (
 )
 from ad_platform.application.interactors.get_campaign_stats import (
     GetCampaignDailyStatsInteractor,
+    GetCampaignsStatsInteractor,
     GetCampaignStatsInteractor,
 )
 from ad_platform.application.interactors.get_campaigns import GetCampaignsInteractor
@@ -24,6 +29,7 @@ def get_interactor_provider() -> Provider:
     provider = Provider()
 
     provider.provide(CreateScoreInteractor, scope=Scope.REQUEST)
+    provider.provide(CreateScoresInteractor, scope=Scope.REQUEST)
     provider.provide(CreateCampaignInteractor, scope=Scope.REQUEST)
     provider.provide(DeleteCampaignInteractor, scope=Scope.REQUEST)
     provider.provide(UpdateCampaignInteractor, scope=Scope.REQUEST)
@@ -34,6 +40,8 @@ def get_interactor_provider() -> Provider:
     provider.provide(GetAdvertiserStatsInteractor, scope=Scope.REQUEST)
     provider.provide(GetCampaignDailyStatsInteractor, scope=Scope.REQUEST)
     provider.provide(GetCampaignStatsInteractor, scope=Scope.REQUEST)
+    provider.provide(GetCampaignsStatsInteractor, scope=Scope.REQUEST)
     provider.provide(UpdateCampaignImageInteractor, scope=Scope.REQUEST)
+    provider.provide(ExportEventsInteractor, scope=Scope.REQUEST)
 
     return provider
@@ -0,0 +1,39 @@
+from collections.abc import AsyncIterator
+
+from ad_platform.application.services.advertiser import AdvertiserService
+from ad_platform.application.services.campaigns import CampaignService
+from ad_platform.application.services.export import ExportService
+from ad_platform.domain.entities import AdvertiserId, CampaignId, DayRange, Event
+from ad_platform.infrastructure.db.commiter import Commiter
+
+
+class ExportEventsInteractor:
+    def __init__(
+        self,
+        advertiser_service: AdvertiserService,
+        campaign_service: CampaignService,
+        export_service: ExportService,
+        commiter: Commiter,
+    ) -> None:
+        self.advertiser_service = advertiser_service
+        self.campaign_service = campaign_service
+        self.export_service = export_service
+        self.commiter = commiter
+
+    async def __call__(
+        self,
+        advertiser_id: AdvertiserId,
+        campaign_id: CampaignId | None,
+        day_range: DayRange,
+    ) -> AsyncIterator[Event]:
+        async with self.commiter.autocommit():
+            await self.advertiser_service.ensure_advertiser_exists(advertiser_id)
+
+            if campaign_id is not None:
+                await self.campaign_service.ensure_campaign_exists_ever(
+                    campaign_id,
+                    advertiser_id,
+                )
+
+        # Сами события читаются уже во время отправки ответа
+        return self.export_service.iter_events(advertiser_id, campaign_id, day_range)
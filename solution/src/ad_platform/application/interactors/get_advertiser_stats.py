@@ -1,6 +1,6 @@
 from ad_platform.application.services.advertiser import AdvertiserService
 from ad_platform.application.services.stats_service import StatsService
-from ad_platform.domain.entities import AdvertiserId, DailyStats, Stats
+from ad_platform.domain.entities import AdvertiserId, DailyStats, DayRange, Stats
 from ad_platform.infrastructure.db.commiter import Commiter
 
 
@@ -16,7 +16,7 @@ class GetAdvertiserStatsInteractor:
         self.commiter = commiter
 
     async def __call__(self, advertiser_id: AdvertiserId) -> Stats:
-        async with self.commiter:
+        async with self.commiter.read_only():
             await self.advertiser_service.ensure_advertiser_exists(advertiser_id)
 
             return await self.stats_service.get_advertiser_stats(advertiser_id)
@@ -33,8 +33,15 @@ class GetAdvertiserDailyStatsInteractor:
         self.stats_service = stats_service
         self.commiter = commiter
 
-    async def __call__(self, advertiser_id: AdvertiserId) -> DailyStats:
-        async with self.commiter:
+    async def __call__(
+        self,
+        advertiser_id: AdvertiserId,
+        day_range: DayRange,
+    ) -> list[DailyStats]:
+        async with self.commiter.read_only():
             await self.advertiser_service.ensure_advertiser_exists(advertiser_id)
 
-            return await self.stats_service.get_advertiser_daily_stats(advertiser_id)
+            return await self.stats_service.get_advertiser_daily_stats(
+                advertiser_id,
+                day_range,
+            )
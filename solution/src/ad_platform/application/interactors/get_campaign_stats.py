@@ -1,6 +1,6 @@
 from ad_platform.application.services.campaigns import CampaignService
 from ad_platform.application.services.stats_service import StatsService
-from ad_platform.domain.entities import CampaignId, DailyStats, Stats
+from ad_platform.domain.entities import CampaignId, CampaignStats, DailyStats, DayRange, Stats
 from ad_platform.infrastructure.db.commiter import Commiter
 
 
@@ -16,7 +16,7 @@ class GetCampaignStatsInteractor:
         self.commiter = commiter
 
     async def __call__(self, campaign_id: CampaignId) -> Stats:
-        async with self.commiter:
+        async with self.commiter.read_only():
             await self.campaign_service.ensure_campaign_exists_ever(campaign_id)
 
             return await self.stats_service.get_campaign_stats(campaign_id)
@@ -33,8 +33,30 @@ class GetCampaignDailyStatsInteractor:
         self.stats_service = stats_service
         self.commiter = commiter
 
-    async def __call__(self, campaign_id: CampaignId) -> list[DailyStats]:
-        async with self.commiter:
+    async def __call__(
+        self,
+        campaign_id: CampaignId,
+        day_range: DayRange,
+    ) -> list[DailyStats]:
+        async with self.commiter.read_only():
             await self.campaign_service.ensure_campaign_exists_ever(campaign_id)
 
-            return await self.stats_service.get_campaign_daily_stats(campaign_id)
+            return await self.stats_service.get_campaign_daily_stats(
+                campaign_id,
+                day_range,
+            )
+
+
+class GetCampaignsStatsInteractor:
+    def __init__(
+        self,
+        stats_service: StatsService,
+        commiter: Commiter,
+    ) -> None:
+        self.stats_service = stats_service
+        self.commiter = commiter
+
+    async def __call__(self, campaign_ids: list[CampaignId]) -> list[CampaignStats]:
+        async with self.commiter.read_only():
+            # Существование кампаний проверяется тем же запросом, что и статистика
+            return await self.stats_service.get_campaigns_stats(campaign_ids)
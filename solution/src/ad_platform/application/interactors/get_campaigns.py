@@ -1,6 +1,6 @@
 from ad_platform.application.services.advertiser import AdvertiserService
 from ad_platform.application.services.campaigns import CampaignService
-from ad_platform.domain.entities import AdvertiserId, Campaign
+from ad_platform.domain.entities import AdvertiserId, Campaign, CampaignId
 from ad_platform.infrastructure.db.commiter import Commiter
 
 
@@ -20,12 +20,14 @@ class GetCampaignsInteractor:
         advertiser_id: AdvertiserId,
         page: int,
         size: int,
+        after: CampaignId | None = None,
     ) -> list[Campaign]:
-        async with self.commiter:
+        async with self.commiter.read_only():
             await self.advertiser_service.ensure_advertiser_exists(advertiser_id)
 
             return await self.campaign_service.get_campaigns(
                 advertiser_id,
                 page,
                 size,
+                after,
             )
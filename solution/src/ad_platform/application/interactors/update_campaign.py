@@ -2,6 +2,7 @@ from io import BytesIO
 
 from ad_platform.application.services.advertiser import AdvertiserService
 from ad_platform.application.services.campaigns import CampaignService
+from ad_platform.application.services.images import ImageService
 from ad_platform.application.services.time import TimeService
 from ad_platform.domain.entities import AdvertiserId, Campaign, CampaignId
 from ad_platform.domain.exceptions import BusinessValidationError
@@ -56,6 +57,8 @@ class UpdateCampaignInteractor:
 
             await self.campaign_service.update_campaign(campaign)
 
+        await self.campaign_service.campaigns_changed(campaign.advertiser_id)
+
         return await self.campaign_service.get_campaign(
             campaign.campaign_id,
             campaign.advertiser_id,
@@ -67,10 +70,12 @@ class UpdateCampaignImageInteractor:
         self,
         campaign_service: CampaignService,
         advertiser_service: AdvertiserService,
+        image_service: ImageService,
         commiter: Commiter,
     ) -> None:
         self.campaign_service = campaign_service
         self.advertiser_service = advertiser_service
+        self.image_service = image_service
         self.commiter = commiter
 
     async def __call__(
@@ -80,18 +85,33 @@ class UpdateCampaignImageInteractor:
         filename: str,
         image: BytesIO,
     ) -> None:
-        async with self.commiter:
-            await self.campaign_service.get_campaign(
-                campaign_id,
-                advertiser_id,
-            )
-
-            if filename is None and image is None:
-                await self.campaign_service.delete_image(campaign_id)
-                return
+        if filename is None and image is None:
+            async with self.commiter:
+                await self.campaign_service.get_campaign(
+                    campaign_id,
+                    advertiser_id,
+                )
+                await self.image_service.delete_image(campaign_id)
+        else:
+            async with self.commiter.autocommit():
+                await self.campaign_service.get_campaign(
+                    campaign_id,
+                    advertiser_id,
+                )
 
             if not filename.endswith(".jpeg") and not filename.endswith(".jpg"):
                 msg = "Неверное расширение файла."
                 raise BusinessValidationError(msg)
 
-            await self.campaign_service.upsert_image(campaign_id, image)
+            # Соединение бд не удерживается на время загрузки в хранилище,
+            # транзакция только выставляет image_url.
+            image_id = await self.image_service.upload_image(campaign_id, image)
+
+            try:
+                async with self.commiter:
+                    await self.image_service.attach_image(campaign_id, image_id)
+            except BaseException:
+                await self.image_service.discard_image(image_id)
+                raise
+
+        await self.campaign_service.campaigns_changed(advertiser_id)
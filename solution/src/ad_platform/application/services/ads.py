@@ -1,37 +1,41 @@
-from ad_platform.domain.entities import CampaignId, Click, ClientId, Impression
+from ad_platform.domain.entities import AdvertiserId, CampaignId, ClientId
 from ad_platform.domain.exceptions import (
     AdAlreadyClickedError,
     AdWasNotShownBeforeError,
+    NotFoundError,
 )
 from ad_platform.infrastructure.db.gateways.common import ActionsGateway
+from ad_platform.infrastructure.db.impressions import ImpressionBuffer
 
 
 class AdsService:
-    def __init__(self, action_gateway: ActionsGateway) -> None:
+    def __init__(
+        self,
+        action_gateway: ActionsGateway,
+        impression_buffer: ImpressionBuffer,
+    ) -> None:
         self.action_gateway = action_gateway
+        self.impression_buffer = impression_buffer
 
-    async def create_impression(self, impression: Impression) -> None:
-        await self.action_gateway.create_impression(impression)
-
-    async def create_click(self, click: Click) -> None:
-        await self.action_gateway.create_click(click)
-
-    async def ensure_ad_shown(
+    async def click(
         self,
         client_id: ClientId,
         campaign_id: CampaignId,
-    ) -> None:
-        res = await self.action_gateway.get_impression(campaign_id, client_id)
+        day: int,
+    ) -> AdvertiserId:
+        # Показ мог ещё не дойти до БД из буфера
+        if self.impression_buffer.is_pending(campaign_id, client_id):
+            await self.impression_buffer.flush()
 
-        if res is None:
-            raise AdWasNotShownBeforeError
+        res = await self.action_gateway.click(campaign_id, client_id, day)
 
-    async def ensure_ad_not_clicked(
-        self,
-        client_id: ClientId,
-        campaign_id: CampaignId,
-    ) -> None:
-        res = await self.action_gateway.get_click(campaign_id, client_id)
+        if not res.client_found or res.advertiser_id is None:
+            raise NotFoundError
+
+        if not res.inserted:
+            if res.shown:
+                raise AdAlreadyClickedError
+
+            raise AdWasNotShownBeforeError
 
-        if res is not None:
-            raise AdAlreadyClickedError
+        return res.advertiser_id
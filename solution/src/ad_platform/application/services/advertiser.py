@@ -1,4 +1,7 @@
-from ad_platform.domain.entities import Advertiser, AdvertiserId, Score
+from collections.abc import AsyncIterable
+from uuid import UUID, uuid4
+
+from ad_platform.domain.entities import Advertiser, AdvertiserId, BulkSummary, Score
 from ad_platform.domain.exceptions import NotFoundError
 from ad_platform.infrastructure.db.commiter import Commiter
 from ad_platform.infrastructure.db.gateways.common import (
@@ -38,9 +41,56 @@ class AdvertiserService:
 
         return advertisers
 
+    async def upsert_advertisers_batches(
+        self,
+        batches: AsyncIterable[list[Advertiser]],
+    ) -> int:
+        upserted = 0
+
+        async for batch in batches:
+            await self.upsert_advertisers(batch)
+            upserted += len(batch)
+
+        return upserted
+
     async def upsert_score(self, score: Score) -> None:
         await self.score_gateway.upsert_score(score)
 
+    async def upsert_scores(self, batches: AsyncIterable[list[Score]]) -> BulkSummary:
+        load_id = uuid4()
+
+        try:
+            # Пока читается тело запроса, соединение берётся только на COPY пачки
+            received = 0
+            async for batch in batches:
+                await self.score_gateway.stage_scores(load_id, batch)
+                received += len(batch)
+
+            async with self.commiter:
+                await self.ensure_staged_refs_exist(load_id)
+                upserted = await self.score_gateway.merge_staged_scores(load_id)
+        finally:
+            await self.score_gateway.discard_staged_scores(load_id)
+
+        return BulkSummary(received=received, upserted=upserted)
+
+    async def ensure_staged_refs_exist(self, load_id: UUID) -> None:
+        missing_clients = await self.score_gateway.get_staged_missing_clients(load_id)
+        if missing_clients:
+            raise NotFoundError(
+                detail="Клиенты не найдены: "
+                f"{', '.join(str(x) for x in missing_clients)}.",
+            )
+
+        missing_advertisers = await self.score_gateway.get_staged_missing_advertisers(
+            load_id,
+        )
+        if missing_advertisers:
+            raise NotFoundError(
+                detail="Рекламодатели не найдены: "
+                f"{', '.join(str(x) for x in missing_advertisers)}.",
+            )
+
     async def ensure_advertiser_exists(self, advertiser_id: AdvertiserId) -> None:
         res = await self.advertiser_gateway.get_advertiser(advertiser_id)
 
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from ad_platform.domain.entities import Campaign, CampaignId, Client, Gender
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    campaign_id: CampaignId
+    age_from: int | None
+    age_to: int | None
+    price_rank: float
+
+
+@dataclass(slots=True)
+class TargetCandidates:
+    campaign_ids: list[CampaignId] = field(default_factory=list)
+    price_ranks: list[float] = field(default_factory=list)
+
+
+def _normalize(value: float, max_value: float) -> float:
+    if not max_value:
+        return 0
+
+    return value / max_value
+
+
+# Индекс кампаний, доступных для показа в текущий день, внутри процесса.
+# Перестраивается при смене дня или после invalidate().
+class CampaignIndex:
+    def __init__(self) -> None:
+        self.buckets: dict[tuple[Gender, str | None], list[IndexEntry]] = {}
+        self.day: int | None = None
+        self.generation = 0
+        self.loaded_generation = -1
+        self.lock = asyncio.Lock()
+
+    def is_fresh(self, day: int) -> bool:
+        return self.day == day and self.loaded_generation == self.generation
+
+    def invalidate(self) -> None:
+        self.generation += 1
+
+    async def ensure_loaded(
+        self,
+        day: int,
+        loader: Callable[[], Awaitable[list[Campaign]]],
+    ) -> None:
+        if self.is_fresh(day):
+            return
+
+        async with self.lock:
+            if self.is_fresh(day):
+                return
+
+            generation = self.generation
+            campaigns = await loader()
+
+            self.build(day, campaigns)
+            self.loaded_generation = generation
+
+    def build(self, day: int, campaigns: list[Campaign]) -> None:
+        # Цены нормализуются по всем неудалённым кампаниям, как и раньше в SQL.
+        max_cpi = max((c.cost_per_impression for c in campaigns), default=0)
+        max_cpc = max((c.cost_per_click for c in campaigns), default=0)
+
+        buckets: dict[tuple[Gender, str | None], list[IndexEntry]] = {}
+
+        for campaign in campaigns:
+            if not campaign.start_date <= day <= campaign.end_date:
+                continue
+
+            if campaign.targeting.gender is None:
+                continue
+
+            key = (campaign.targeting.gender, campaign.targeting.location)
+            buckets.setdefault(key, []).append(
+                IndexEntry(
+                    campaign_id=campaign.campaign_id,
+                    age_from=campaign.targeting.age_from,
+                    age_to=campaign.targeting.age_to,
+                    price_rank=2
+                    * (
+                        _normalize(campaign.cost_per_impression, max_cpi)
+                        + 0.2 * _normalize(campaign.cost_per_click, max_cpc)
+                    ),
+                ),
+            )
+
+        self.buckets = buckets
+        self.day = day
+
+        logger.info(
+            "Campaign index built for day %s: %s campaigns in %s buckets",
+            day,
+            sum(len(entries) for entries in buckets.values()),
+            len(buckets),
+        )
+
+    def get_candidates(self, client: Client) -> TargetCandidates:
+        gender = Gender[client.gender.value]
+        candidates = TargetCandidates()
+
+        for key in (
+            (Gender.ALL, None),
+            (Gender.ALL, client.location),
+            (gender, None),
+            (gender, client.location),
+        ):
+            for entry in self.buckets.get(key, ()):
+                if entry.age_from is not None and entry.age_from > client.age:
+                    continue
+                if entry.age_to is not None and entry.age_to < client.age:
+                    continue
+
+                candidates.campaign_ids.append(entry.campaign_id)
+                candidates.price_ranks.append(entry.price_rank)
+
+        return candidates
@@ -1,30 +1,70 @@
+from collections.abc import AsyncIterable
+
 from ad_platform.domain.entities import Client, ClientId
 from ad_platform.domain.exceptions import NotFoundError
+from ad_platform.infrastructure.cache.lru import ClientCache
 from ad_platform.infrastructure.db.commiter import Commiter
 from ad_platform.infrastructure.db.gateways.common import ClientGateway
 
 
 class ClientService:
-    def __init__(self, client_gateway: ClientGateway, commiter: Commiter) -> None:
+    def __init__(
+        self,
+        client_gateway: ClientGateway,
+        client_cache: ClientCache,
+        commiter: Commiter,
+    ) -> None:
         self.client_gateway = client_gateway
+        self.client_cache = client_cache
         self.commiter = commiter
 
     async def get_client(self, client_id: ClientId) -> Client:
+        res = self.client_cache.get(client_id)
+        if res is not None:
+            return res
+
         res = await self.client_gateway.get_client(client_id)
 
         if res is None:
             raise NotFoundError
 
+        self.client_cache.put(client_id, res)
+
         return res
 
     async def upsert_clients(self, clients: list[Client]) -> list[Client]:
         async with self.commiter:
             await self.client_gateway.upsert_clients(clients)
 
+        # Кэш обновляется только после коммита; в него кладутся доменные
+        # сущности, не модели запроса
+        for client in clients:
+            self.client_cache.put(
+                client.client_id,
+                Client(
+                    client_id=client.client_id,
+                    login=client.login,
+                    age=client.age,
+                    location=client.location,
+                    gender=client.gender,
+                ),
+            )
+
         return clients
 
-    async def ensure_client_exists(self, client_id: ClientId) -> None:
-        res = await self.client_gateway.get_client(client_id)
+    async def upsert_clients_batches(
+        self,
+        batches: AsyncIterable[list[Client]],
+    ) -> int:
+        # Каждая пачка коммитится отдельно, чтобы загрузка не держала одну
+        # длинную транзакцию; повтор загрузки безопасен
+        upserted = 0
 
-        if res is None:
-            raise NotFoundError
+        async for batch in batches:
+            await self.upsert_clients(batch)
+            upserted += len(batch)
+
+        return upserted
+
+    async def ensure_client_exists(self, client_id: ClientId) -> None:
+        await self.get_client(client_id)
@@ -2,8 +2,12 @@ from dishka import Provider, Scope
 
 from ad_platform.application.services.ads import AdsService
 from ad_platform.application.services.advertiser import AdvertiserService
+from ad_platform.application.services.campaign_index import CampaignIndex
 from ad_platform.application.services.campaigns import CampaignService
 from ad_platform.application.services.client import ClientService
+from ad_platform.application.services.export import ExportService
+from ad_platform.application.services.images import ImageService
+from ad_platform.application.services.serving import ServingService
 from ad_platform.application.services.stats_service import StatsService
 from ad_platform.application.services.time import TimeService
 
@@ -11,11 +15,15 @@ from ad_platform.application.services.time import TimeService
 def get_service_provider() -> Provider:
     provider = Provider()
 
+    provider.provide(CampaignIndex, scope=Scope.APP)
     provider.provide(AdvertiserService, scope=Scope.REQUEST)
     provider.provide(ClientService, scope=Scope.REQUEST)
     provider.provide(CampaignService, scope=Scope.REQUEST)
+    provider.provide(ImageService, scope=Scope.REQUEST)
+    provider.provide(ServingService, scope=Scope.REQUEST)
     provider.provide(TimeService, scope=Scope.REQUEST)
     provider.provide(AdsService, scope=Scope.REQUEST)
     provider.provide(StatsService, scope=Scope.REQUEST)
+    provider.provide(ExportService, scope=Scope.REQUEST)
 
     return provider
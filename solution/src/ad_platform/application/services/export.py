@@ -0,0 +1,17 @@
+from collections.abc import AsyncIterator
+
+from ad_platform.domain.entities import AdvertiserId, CampaignId, DayRange, Event
+from ad_platform.infrastructure.db.gateways.common import ExportGateway
+
+
+class ExportService:
+    def __init__(self, export_gateway: ExportGateway) -> None:
+        self.export_gateway = export_gateway
+
+    def iter_events(
+        self,
+        advertiser_id: AdvertiserId,
+        campaign_id: CampaignId | None,
+        day_range: DayRange,
+    ) -> AsyncIterator[Event]:
+        return self.export_gateway.iter_events(advertiser_id, campaign_id, day_range)
@@ -0,0 +1,67 @@
+import logging
+from io import BytesIO
+from uuid import uuid4
+
+from ad_platform.domain.entities import CampaignId
+from ad_platform.domain.exceptions import NotFoundError
+from ad_platform.infrastructure.db.gateways.common import (
+    CampaignGateway,
+    ImageUploadGateway,
+)
+from ad_platform.infrastructure.storage.common import ImageGateway
+from ad_platform.infrastructure.storage.config import StorageConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ImageService:
+    def __init__(
+        self,
+        campaign_gateway: CampaignGateway,
+        images_gateway: ImageGateway,
+        image_upload_gateway: ImageUploadGateway,
+        config: StorageConfig,
+    ) -> None:
+        self.campaign_gateway = campaign_gateway
+        self.images_gateway = images_gateway
+        self.image_upload_gateway = image_upload_gateway
+        self.cdn_url = config.cdn
+
+    # Загрузка идёт вне транзакции: сначала запись в image_uploads, чтобы
+    # объект нашла очистка, если процесс упадёт до привязки к кампании.
+    async def upload_image(self, campaign_id: CampaignId, image: BytesIO) -> str:
+        image_id = str(uuid4()) + ".jpg"
+
+        await self.image_upload_gateway.add_upload(image_id, campaign_id)
+
+        try:
+            await self.images_gateway.put(image, image_id)
+        except BaseException:
+            await self.discard_image(image_id)
+            raise
+
+        return image_id
+
+    async def attach_image(self, campaign_id: CampaignId, image_id: str) -> str:
+        if not await self.campaign_gateway.update_campaign_image(
+            campaign_id,
+            image_id,
+        ):
+            raise NotFoundError
+
+        await self.image_upload_gateway.remove_upload(image_id)
+
+        return self.cdn_url + image_id
+
+    async def discard_image(self, image_id: str) -> None:
+        try:
+            await self.images_gateway.delete(image_id)
+        except Exception:
+            # Запись остаётся в image_uploads, объект удалит очистка.
+            logger.warning("Failed to delete image %s", image_id, exc_info=True)
+            return
+
+        await self.image_upload_gateway.remove_upload(image_id)
+
+    async def delete_image(self, campaign_id: CampaignId) -> None:
+        await self.campaign_gateway.update_campaign_image(campaign_id, None)
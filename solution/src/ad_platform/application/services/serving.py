@@ -0,0 +1,63 @@
+from ad_platform.application.services.campaign_index import CampaignIndex
+from ad_platform.domain.entities import Campaign, Client, Impression
+from ad_platform.domain.exceptions import NotFoundError
+from ad_platform.infrastructure.db.gateways.common import CampaignGateway
+from ad_platform.infrastructure.db.impressions import ImpressionBuffer
+from ad_platform.infrastructure.storage.config import StorageConfig
+
+
+class ServingService:
+    def __init__(
+        self,
+        campaign_gateway: CampaignGateway,
+        campaign_index: CampaignIndex,
+        impression_buffer: ImpressionBuffer,
+        config: StorageConfig,
+    ) -> None:
+        self.campaign_gateway = campaign_gateway
+        self.campaign_index = campaign_index
+        self.impression_buffer = impression_buffer
+        self.cdn_url = config.cdn
+
+    async def serve_campaign(self, day: int, client: Client) -> Campaign:
+        await self.campaign_index.ensure_loaded(
+            day,
+            self.campaign_gateway.get_active_campaigns,
+        )
+        candidates = self.campaign_index.get_candidates(client)
+
+        res = None
+        if candidates.campaign_ids and self.impression_buffer.enabled:
+            res = await self.campaign_gateway.pick_campaign(
+                client.client_id,
+                candidates.campaign_ids,
+                candidates.price_ranks,
+                [
+                    self.impression_buffer.pending_counts[campaign_id]
+                    for campaign_id in candidates.campaign_ids
+                ],
+            )
+            if res is not None:
+                await self.impression_buffer.put(
+                    Impression(
+                        campaign_id=res.campaign_id,
+                        client_id=client.client_id,
+                        day=day,
+                        price=res.cost_per_impression,
+                    ),
+                )
+        elif candidates.campaign_ids:
+            res = await self.campaign_gateway.serve_campaign(
+                client.client_id,
+                day,
+                candidates.campaign_ids,
+                candidates.price_ranks,
+            )
+
+        if res is None:
+            raise NotFoundError(detail="Нет доступных объявлений.")
+
+        if res.image_url is not None:
+            res.image_url = self.cdn_url + res.image_url
+
+        return res
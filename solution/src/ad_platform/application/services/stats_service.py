@@ -1,66 +1,146 @@
-from ad_platform.domain.entities import AdvertiserId, CampaignId, DailyStats, Stats
-from ad_platform.infrastructure.db.gateways.common import ActionsGateway
+import json
+from dataclasses import asdict
+
+from ad_platform.domain.entities import (
+    AdvertiserId,
+    CampaignId,
+    CampaignStats,
+    DailyStats,
+    DayRange,
+    Stats,
+)
+from ad_platform.domain.exceptions import NotFoundError
+from ad_platform.infrastructure.cache.common import CacheGateway
+from ad_platform.infrastructure.cache.config import CacheConfig
+from ad_platform.infrastructure.db.gateways.common import StatsGateway
 
 
 class StatsService:
     def __init__(
         self,
-        action_gateway: ActionsGateway,
+        stats_gateway: StatsGateway,
+        cache_gateway: CacheGateway,
+        config: CacheConfig,
     ) -> None:
-        self.action_gateway = action_gateway
+        self.stats_gateway = stats_gateway
+        self.cache_gateway = cache_gateway
+        self.cache_ttl = config.stats_cache_ttl
+
+    async def get_cached(self, key: str) -> list[dict] | dict | None:
+        if not self.cache_ttl:
+            return None
+
+        cached = await self.cache_gateway.get(key)
+        if cached is None:
+            return None
+
+        return json.loads(cached)
+
+    async def set_cached(self, key: str, value: Stats | list[DailyStats]) -> None:
+        if not self.cache_ttl:
+            return
+
+        data = [asdict(x) for x in value] if isinstance(value, list) else asdict(value)
+
+        await self.cache_gateway.set(key, json.dumps(data), ttl=self.cache_ttl)
 
     async def get_campaign_stats(self, campaign_id: CampaignId) -> Stats:
-        res = await self.action_gateway.get_campaign_stats(campaign_id)
+        key = f"stats:campaign:{campaign_id}"
+        cached = await self.get_cached(key)
+        if cached is not None:
+            return Stats(**cached)
 
-        res.conversion = (
-            res.clicks_count / res.impressions_count
-            if res.impressions_count != 0
-            else 0
-        )
+        res = await self.stats_gateway.get_campaign_stats(campaign_id)
+        await self.set_cached(key, res)
 
         return res
 
+    async def get_campaigns_stats(
+        self,
+        campaign_ids: list[CampaignId],
+    ) -> list[CampaignStats]:
+        campaign_ids = list(dict.fromkeys(campaign_ids))
+
+        res = {
+            stats.campaign_id: stats
+            for stats in await self.stats_gateway.get_campaigns_stats(campaign_ids)
+        }
+
+        missing = [str(x) for x in campaign_ids if x not in res]
+        if missing:
+            raise NotFoundError(detail=f"Кампании не найдены: {', '.join(missing)}.")
+
+        return [res[campaign_id] for campaign_id in campaign_ids]
+
     async def get_advertiser_stats(self, advertiser_id: AdvertiserId) -> Stats:
-        res = await self.action_gateway.get_advertiser_stats(advertiser_id)
+        key = f"stats:advertiser:{advertiser_id}"
+        cached = await self.get_cached(key)
+        if cached is not None:
+            return Stats(**cached)
 
-        res.conversion = (
-            res.clicks_count / res.impressions_count
-            if res.impressions_count != 0
-            else 0
-        )
+        res = await self.stats_gateway.get_advertiser_stats(advertiser_id)
+        await self.set_cached(key, res)
 
         return res
 
     async def get_campaign_daily_stats(
         self,
         campaign_id: CampaignId,
+        day_range: DayRange,
     ) -> list[DailyStats]:
-        res = await self.action_gateway.get_campaign_daily_stats(
+        # Кэшируется только полная история, её ключ сбрасывается в invalidate()
+        key = f"stats:campaign_daily:{campaign_id}"
+        cacheable = day_range == DayRange()
+
+        if cacheable:
+            cached = await self.get_cached(key)
+            if cached is not None:
+                return [DailyStats(**day) for day in cached]
+
+        res = await self.stats_gateway.get_campaign_daily_stats(
             campaign_id,
+            day_range,
         )
 
-        for day in res:
-            day.conversion = (
-                day.clicks_count / day.impressions_count
-                if day.impressions_count != 0
-                else 0
-            )
+        if cacheable:
+            await self.set_cached(key, res)
 
         return res
 
     async def get_advertiser_daily_stats(
         self,
         advertiser_id: AdvertiserId,
+        day_range: DayRange,
     ) -> list[DailyStats]:
-        res = await self.action_gateway.get_advertiser_daily_stats(
+        key = f"stats:advertiser_daily:{advertiser_id}"
+        cacheable = day_range == DayRange()
+
+        if cacheable:
+            cached = await self.get_cached(key)
+            if cached is not None:
+                return [DailyStats(**day) for day in cached]
+
+        res = await self.stats_gateway.get_advertiser_daily_stats(
             advertiser_id,
+            day_range,
         )
 
-        for day in res:
-            day.conversion = (
-                day.clicks_count / day.impressions_count
-                if day.impressions_count != 0
-                else 0
-            )
+        if cacheable:
+            await self.set_cached(key, res)
 
         return res
+
+    async def invalidate(
+        self,
+        campaign_id: CampaignId,
+        advertiser_id: AdvertiserId,
+    ) -> None:
+        if not self.cache_ttl:
+            return
+
+        await self.cache_gateway.delete(
+            f"stats:campaign:{campaign_id}",
+            f"stats:campaign_daily:{campaign_id}",
+            f"stats:advertiser:{advertiser_id}",
+            f"stats:advertiser_daily:{advertiser_id}",
+        )
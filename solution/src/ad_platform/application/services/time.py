@@ -1,3 +1,4 @@
+from ad_platform.infrastructure.cache.clock import Clock
 from ad_platform.infrastructure.cache.common import CacheGateway
 from ad_platform.infrastructure.db.commiter import Commiter
 from ad_platform.infrastructure.db.gateways.common import TimeGateway
@@ -8,20 +9,29 @@ class TimeService:
         self,
         time_gateway: TimeGateway,
         cache_gateway: CacheGateway,
+        clock: Clock,
         commiter: Commiter,
     ) -> None:
         self.time_gateway = time_gateway
         self.cache_gateway = cache_gateway
+        self.clock = clock
         self.commiter = commiter
 
     async def get_time(self) -> int:
+        if self.clock.day is not None:
+            return self.clock.day
+
+        version = self.clock.version
+
         cached = await self.cache_gateway.get("time")
         if cached is not None:
+            self.clock.load(int(cached), version)
             return int(cached)
 
         time = await self.time_gateway.get_time()
 
         await self.cache_gateway.set("time", str(time))
+        self.clock.load(time, version)
 
         return time
 
@@ -30,4 +40,7 @@ class TimeService:
             await self.time_gateway.advance_time(time)
             await self.cache_gateway.set("time", str(time))
 
+        self.clock.set(time)
+        await self.clock.publish(time)
+
         return time
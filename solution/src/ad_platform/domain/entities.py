@@ -78,6 +78,14 @@ class Click:
     price: float
 
 
+@dataclass(frozen=True, slots=True)
+class ClickResult:
+    advertiser_id: Optional[AdvertiserId]
+    client_found: bool
+    shown: bool
+    inserted: bool
+
+
 @dataclass(slots=True)
 class Impression:
     campaign_id: CampaignId
@@ -86,6 +94,20 @@ class Impression:
     price: float
 
 
+class EventType(Enum):
+    IMPRESSION = "impression"
+    CLICK = "click"
+
+
+@dataclass(slots=True)
+class Event:
+    event: EventType
+    campaign_id: CampaignId
+    client_id: ClientId
+    day: int
+    price: float
+
+
 @dataclass(slots=True)
 class UserCampaign:
     ad_id: CampaignId
@@ -95,6 +117,12 @@ class UserCampaign:
     image_url: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class BulkSummary:
+    received: int
+    upserted: int
+
+
 @dataclass(slots=True)
 class Stats:
     impressions_count: int
@@ -108,3 +136,16 @@ class Stats:
 @dataclass(slots=True)
 class DailyStats(Stats):
     date: int
+
+
+@dataclass(slots=True)
+class CampaignStats(Stats):
+    campaign_id: CampaignId
+
+
+@dataclass(frozen=True, slots=True)
+class DayRange:
+    from_day: int = 0
+    to_day: Optional[int] = None
+    after: Optional[int] = None
+    limit: Optional[int] = None
@@ -0,0 +1,69 @@
+import asyncio
+import contextlib
+import logging
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+TIME_CHANNEL = "time"
+
+
+# Текущий день в памяти процесса. Изменения рассылаются всем процессам
+# через Redis pub/sub.
+class Clock:
+    def __init__(self, cache: Redis, channel: str = TIME_CHANNEL) -> None:
+        self.cache = cache
+        self.channel = channel
+        self.day: int | None = None
+        self.version = 0
+        self.subscribed = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.task
+
+    def set(self, day: int) -> None:
+        self.day = day
+        self.version += 1
+
+    def load(self, day: int, version: int) -> None:
+        # Без подписки значение нельзя держать в памяти; значение,
+        # прочитанное до пришедшего уведомления, уже устарело
+        if self.subscribed.is_set() and self.version == version:
+            self.day = day
+
+    async def publish(self, day: int) -> None:
+        await self.cache.publish(self.channel, str(day))
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Time subscription lost, resubscribing")
+
+            # Пока подписки нет, день читается из Redis на каждом запросе
+            self.subscribed.clear()
+            self.day = None
+            self.version += 1
+            await asyncio.sleep(1)
+
+    async def listen(self) -> None:
+        async with self.cache.pubsub() as pubsub:
+            await pubsub.subscribe(self.channel)
+            self.subscribed.set()
+
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self.set(int(message["data"]))
@@ -7,4 +7,7 @@ class CacheGateway(Protocol):
     async def get(self, key: str) -> str | None: ...
 
     @abstractmethod
-    async def set(self, key: str, value: str) -> None: ...
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
@@ -6,10 +6,16 @@ from dataclasses import dataclass
 class CacheConfig:
     host: str
     port: int
+    client_cache_size: int
+    client_cache_ttl: float
+    stats_cache_ttl: int
 
 
 def get_cache_config() -> CacheConfig:
     return CacheConfig(
         host=os.getenv("REDIS_HOST"),
         port=int(os.getenv("REDIS_PORT")),
+        client_cache_size=int(os.getenv("CLIENT_CACHE_SIZE", "100000")),
+        client_cache_ttl=float(os.getenv("CLIENT_CACHE_TTL", "30")),
+        stats_cache_ttl=int(os.getenv("STATS_CACHE_TTL", "0")),
     )
@@ -1,20 +1,39 @@
+from collections.abc import AsyncIterator
+
 from dishka import Provider, Scope
 from redis.asyncio import Redis
 
+from ad_platform.infrastructure.cache.clock import Clock
 from ad_platform.infrastructure.cache.common import CacheGateway
 from ad_platform.infrastructure.cache.config import CacheConfig, get_cache_config
 from ad_platform.infrastructure.cache.impl import CacheGatewayImpl
+from ad_platform.infrastructure.cache.lru import ClientCache
 
 
 async def get_cache_connection(config: CacheConfig) -> Redis:
     return await Redis.from_url(f"redis://{config.host}:{config.port}")
 
 
+async def get_clock(cache: Redis) -> AsyncIterator[Clock]:
+    clock = Clock(cache)
+    clock.start()
+
+    yield clock
+
+    await clock.close()
+
+
+def get_client_cache(config: CacheConfig) -> ClientCache:
+    return ClientCache(config.client_cache_size, config.client_cache_ttl)
+
+
 def get_cache_provider() -> Provider:
     provider = Provider()
 
     provider.provide(get_cache_config, scope=Scope.APP)
     provider.provide(get_cache_connection, scope=Scope.APP)
+    provider.provide(get_clock, scope=Scope.APP)
+    provider.provide(get_client_cache, scope=Scope.APP)
     provider.provide(CacheGatewayImpl, scope=Scope.REQUEST, provides=CacheGateway)
 
     return provider
@@ -12,5 +12,8 @@ class CacheGatewayImpl(CacheGateway):
     async def get(self, key: str) -> str | None:
         return cast(str | None, await self.cache.get(key))
 
-    async def set(self, key: str, value: str) -> None:
-        await self.cache.set(key, value)
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        await self.cache.set(key, value, ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        await self.cache.delete(*keys)
@@ -0,0 +1,58 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from ad_platform.domain.entities import Client, ClientId
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+# LRU-кэш внутри процесса, записи живут ограниченное время
+class LRUCache(Generic[K, V]):
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        entry = self.entries.get(key)
+
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        if self.max_size <= 0:
+            return
+
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self.entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class ClientCache(LRUCache[ClientId, Client]):
+    pass
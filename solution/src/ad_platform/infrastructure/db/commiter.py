@@ -1,9 +1,14 @@
 import logging
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from types import TracebackType
-from typing import Optional, Protocol, Self
+from typing import TYPE_CHECKING, Optional, Protocol, Self
 
-import asyncpg
+from ad_platform.infrastructure.db.connection import LazyConnection, ReplicaConnection
+
+if TYPE_CHECKING:
+    from asyncpg.transaction import Transaction
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +21,10 @@ class Commiter(Protocol):
     @abstractmethod
     async def rollback(self) -> None: ...
     @abstractmethod
+    def read_only(self) -> AbstractAsyncContextManager[Self]: ...
+    @abstractmethod
+    def autocommit(self) -> AbstractAsyncContextManager[Self]: ...
+    @abstractmethod
     async def __aenter__(self) -> Self: ...
 
     @abstractmethod
@@ -32,30 +41,78 @@ class CommiterError(Exception):
 
 
 class CommiterImpl(Commiter):
-    def __init__(self, conn: asyncpg.Connection) -> None:
+    def __init__(self, conn: LazyConnection, replica: ReplicaConnection) -> None:
         self.conn = conn
+        self.replica = replica
+        self.transactions: list[tuple[LazyConnection, Transaction]] = []
 
     async def begin(self) -> None:
-        self.transaction = self.conn.transaction()
+        await self.start(self.conn)
 
-        await self.transaction.start()
+    async def start(
+        self,
+        conn: LazyConnection,
+        *,
+        isolation: str | None = None,
+        readonly: bool = False,
+    ) -> None:
+        # Соединение удерживается до конца транзакции
+        raw_conn = await conn.acquire()
+        transaction = raw_conn.transaction(isolation=isolation, readonly=readonly)
+
+        try:
+            await transaction.start()
+        except BaseException:
+            await conn.release()
+            raise
+
+        self.transactions.append((conn, transaction))
 
     async def commit(self) -> None:
-        if self.transaction is None:
+        if not self.transactions:
             msg = "Transaction is not started"
             raise CommiterError(msg)
 
-        await self.transaction.commit()
+        conn, transaction = self.transactions.pop()
+        try:
+            await transaction.commit()
+        finally:
+            await conn.release()
 
     async def rollback(self) -> None:
-        if self.transaction is None:
+        if not self.transactions:
             msg = "Transaction is not started"
             raise CommiterError(msg)
 
-        await self.transaction.rollback()
+        conn, transaction = self.transactions.pop()
+        try:
+            await transaction.rollback()
+        finally:
+            await conn.release()
+
+    @asynccontextmanager
+    async def read_only(self) -> AsyncIterator[Self]:
+        # Транзакция на реплике: чтения из неё видят один снимок данных.
+        # Запросы к основной БД в блоке выполняются вне этой транзакции
+        logger.debug("Begin read only transaction")
+        await self.start(self.replica, isolation="repeatable_read", readonly=True)
+
+        try:
+            yield self
+        except BaseException:
+            await self.rollback()
+            raise
+
+        await self.commit()
+
+    @asynccontextmanager
+    async def autocommit(self) -> AsyncIterator[Self]:
+        # Для чтений, которым не нужен общий снимок данных: каждый запрос
+        # выполняется отдельно, без BEGIN/COMMIT
+        yield self
 
     async def __aenter__(self) -> Self:
-        logger.info("Begin transaction")
+        logger.debug("Begin transaction")
         await self.begin()
 
         return self
@@ -67,10 +124,10 @@ class CommiterImpl(Commiter):
         traceback: Optional[TracebackType],
     ) -> Optional[bool]:
         if exc_type is None:
-            logger.info("Commit transaction")
+            logger.debug("Commit transaction")
             await self.commit()
         else:
-            logger.info("Rollback transaction")
+            logger.debug("Rollback transaction")
             await self.rollback()
 
         return False
@@ -8,12 +8,53 @@ class DBConfig:
     port: int
     user: str
     password: str
+    pool_min_size: int
+    pool_max_size: int
+    statement_cache_size: int
+    command_timeout: float | None
+    max_inactive_connection_lifetime: float
+    replica_host: str | None
+    replica_port: int
+    replica_lag: int
 
 
 def get_db_config() -> DBConfig:
+    command_timeout = os.getenv("POSTGRES_COMMAND_TIMEOUT")
+
     return DBConfig(
         host=os.getenv("POSTGRES_HOST"),
         port=int(os.getenv("POSTGRES_PORT")),
         user=os.getenv("POSTGRES_USER"),
         password=os.getenv("POSTGRES_PASSWORD"),
+        pool_min_size=int(os.getenv("POSTGRES_POOL_MIN_SIZE", "10")),
+        pool_max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+        statement_cache_size=int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "100")),
+        command_timeout=float(command_timeout) if command_timeout else None,
+        max_inactive_connection_lifetime=float(
+            os.getenv("POSTGRES_MAX_INACTIVE_CONNECTION_LIFETIME", "300"),
+        ),
+        replica_host=os.getenv("POSTGRES_REPLICA_HOST") or None,
+        replica_port=int(
+            os.getenv("POSTGRES_REPLICA_PORT") or os.getenv("POSTGRES_PORT"),
+        ),
+        replica_lag=int(os.getenv("POSTGRES_REPLICA_LAG", "5")),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ImpressionBufferConfig:
+    enabled: bool
+    flush_interval: float
+    batch_size: int
+    max_size: int
+    max_retries: int
+
+
+def get_impression_buffer_config() -> ImpressionBufferConfig:
+    return ImpressionBufferConfig(
+        enabled=os.getenv("IMPRESSION_BUFFER_ENABLED", "false").lower() == "true",
+        flush_interval=int(os.getenv("IMPRESSION_BUFFER_FLUSH_MS", "100")) / 1000,
+        batch_size=int(os.getenv("IMPRESSION_BUFFER_BATCH_SIZE", "1000")),
+        max_size=int(os.getenv("IMPRESSION_BUFFER_MAX_SIZE", "10000")),
+        max_retries=int(os.getenv("IMPRESSION_BUFFER_MAX_RETRIES", "3")),
     )
@@ -0,0 +1,105 @@
+from collections.abc import Iterable, Sequence
+from typing import Any, NewType
+
+from asyncpg import Connection, Pool, Record
+
+from ad_platform.infrastructure.db.metrics import PoolMetrics
+
+# Пул реплики; если реплика не настроена, это основной пул
+ReplicaPool = NewType("ReplicaPool", Pool)
+
+
+async def reset_connection(conn: Connection) -> None:
+    # Приложение не меняет состояние сессии (SET, LISTEN, advisory-блокировки),
+    # незавершённую транзакцию asyncpg откатывает сам, поэтому reset-запрос
+    # при каждом возврате соединения в пул не нужен
+    return
+
+
+# Соединение, которое берётся из пула только на время запроса к БД или
+# транзакции и сразу возвращается обратно.
+class LazyConnection:
+    def __init__(self, pool: Pool, metrics: PoolMetrics) -> None:
+        self.pool = pool
+        self.metrics = metrics
+        self.conn: Connection | None = None
+        self.depth = 0
+
+    async def acquire(self) -> Connection:
+        if self.conn is None:
+            self.conn = await self.metrics.acquire(self.pool)
+
+        self.depth += 1
+
+        return self.conn
+
+    async def release(self) -> None:
+        self.depth -= 1
+
+        if self.depth == 0 and self.conn is not None:
+            conn, self.conn = self.conn, None
+            await self.metrics.release(self.pool, conn)
+
+    def in_transaction(self) -> bool:
+        return self.conn is not None and self.conn.is_in_transaction()
+
+    async def close(self) -> None:
+        if self.conn is not None:
+            self.depth = 1
+            await self.release()
+
+    async def execute(self, query: str, *args: object) -> str:
+        conn = await self.acquire()
+        try:
+            return await conn.execute(query, *args)
+        finally:
+            await self.release()
+
+    async def executemany(self, query: str, args: Iterable[Any]) -> None:
+        conn = await self.acquire()
+        try:
+            await conn.executemany(query, args)
+        finally:
+            await self.release()
+
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        *,
+        records: Iterable[Sequence[Any]],
+        columns: Sequence[str],
+    ) -> str:
+        conn = await self.acquire()
+        try:
+            return await conn.copy_records_to_table(
+                table_name,
+                records=records,
+                columns=columns,
+            )
+        finally:
+            await self.release()
+
+    async def fetch(self, query: str, *args: object) -> list[Record]:
+        conn = await self.acquire()
+        try:
+            return await conn.fetch(query, *args)
+        finally:
+            await self.release()
+
+    async def fetchrow(self, query: str, *args: object) -> Record | None:
+        conn = await self.acquire()
+        try:
+            return await conn.fetchrow(query, *args)
+        finally:
+            await self.release()
+
+    async def fetchval(self, query: str, *args: object) -> Any:  # noqa: ANN401
+        conn = await self.acquire()
+        try:
+            return await conn.fetchval(query, *args)
+        finally:
+            await self.release()
+
+
+class ReplicaConnection(LazyConnection):
+    pass
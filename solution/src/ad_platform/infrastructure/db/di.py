@@ -1,10 +1,21 @@
 from collections.abc import AsyncIterator
 
-from asyncpg import Connection, Pool, create_pool
+from asyncpg import Pool, create_pool
 from dishka import Provider, Scope
 
 from ad_platform.infrastructure.db.commiter import Commiter, CommiterImpl
-from ad_platform.infrastructure.db.config import DBConfig, get_db_config
+from ad_platform.infrastructure.db.config import (
+    DBConfig,
+    ImpressionBufferConfig,
+    get_db_config,
+    get_impression_buffer_config,
+)
+from ad_platform.infrastructure.db.connection import (
+    LazyConnection,
+    ReplicaConnection,
+    ReplicaPool,
+    reset_connection,
+)
 from ad_platform.infrastructure.db.gateways.ads import ActionsGatewayImpl
 from ad_platform.infrastructure.db.gateways.advertiser import AdvertiserGatewayImpl
 from ad_platform.infrastructure.db.gateways.campaign import CampaignGatewayImpl
@@ -13,65 +24,153 @@ from ad_platform.infrastructure.db.gateways.common import (
     ActionsGateway,
     AdvertiserGateway,
     CampaignGateway,
+    CampaignListGateway,
     ClientGateway,
+    ExportGateway,
+    ImageUploadGateway,
     ScoresGateway,
+    StatsGateway,
     TimeGateway,
 )
+from ad_platform.infrastructure.db.gateways.export import ExportGatewayImpl
+from ad_platform.infrastructure.db.gateways.image_uploads import ImageUploadGatewayImpl
 from ad_platform.infrastructure.db.gateways.scores import ScoresGatewayImpl
+from ad_platform.infrastructure.db.gateways.stats import StatsGatewayImpl
 from ad_platform.infrastructure.db.gateways.time import TimeGatewayImpl
+from ad_platform.infrastructure.db.impressions import ImpressionBuffer
+from ad_platform.infrastructure.db.metrics import PoolMetrics, ReplicaPoolMetrics
+from ad_platform.infrastructure.db.replica import ReplicaRouter
 
 
-async def get_db_pool(config: DBConfig) -> Pool:
+async def create_db_pool(config: DBConfig, host: str, port: int) -> Pool:
     return await create_pool(
-        host=config.host,
-        port=config.port,
+        host=host,
+        port=port,
         user=config.user,
         password=config.password,
+        min_size=config.pool_min_size,
+        max_size=config.pool_max_size,
+        statement_cache_size=config.statement_cache_size,
+        command_timeout=config.command_timeout,
+        max_inactive_connection_lifetime=config.max_inactive_connection_lifetime,
+        reset=reset_connection,
+    )
+
+
+async def get_db_pool(config: DBConfig) -> Pool:
+    return await create_db_pool(config, config.host, config.port)
+
+
+async def get_replica_pool(config: DBConfig, pool: Pool) -> ReplicaPool:
+    if config.replica_host is None:
+        return ReplicaPool(pool)
+
+    return ReplicaPool(
+        await create_db_pool(config, config.replica_host, config.replica_port),
     )
 
 
-async def get_db_connection(pool: Pool) -> AsyncIterator[Connection]:
-    conn = await pool.acquire()
+def get_replica_pool_metrics(
+    config: DBConfig,
+    metrics: PoolMetrics,
+) -> ReplicaPoolMetrics:
+    if config.replica_host is None:
+        return ReplicaPoolMetrics(metrics)
+
+    return ReplicaPoolMetrics(PoolMetrics())
+
+
+async def get_db_connection(
+    pool: Pool,
+    metrics: PoolMetrics,
+) -> AsyncIterator[LazyConnection]:
+    conn = LazyConnection(pool, metrics)
 
     yield conn
 
-    await pool.release(conn)
+    await conn.close()
+
+
+async def get_replica_connection(
+    pool: ReplicaPool,
+    metrics: ReplicaPoolMetrics,
+) -> AsyncIterator[ReplicaConnection]:
+    conn = ReplicaConnection(pool, metrics)
+
+    yield conn
+
+    await conn.close()
+
 
+async def get_impression_buffer(
+    pool: Pool,
+    config: ImpressionBufferConfig,
+) -> AsyncIterator[ImpressionBuffer]:
+    buffer = ImpressionBuffer(pool, config)
+    buffer.start()
 
-def get_commiter(conn: Connection) -> CommiterImpl:
-    return CommiterImpl(conn)
+    yield buffer
 
+    await buffer.close()
 
-def get_client_gateway(conn: Connection) -> ClientGatewayImpl:
+
+def get_commiter(conn: LazyConnection, replica: ReplicaConnection) -> CommiterImpl:
+    return CommiterImpl(conn, replica)
+
+
+def get_client_gateway(conn: LazyConnection) -> ClientGatewayImpl:
     return ClientGatewayImpl(conn)
 
 
-def get_advertiser_gateway(conn: Connection) -> AdvertiserGatewayImpl:
+def get_advertiser_gateway(conn: LazyConnection) -> AdvertiserGatewayImpl:
     return AdvertiserGatewayImpl(conn)
 
 
-def get_score_gateway(conn: Connection) -> ScoresGatewayImpl:
+def get_score_gateway(conn: LazyConnection) -> ScoresGatewayImpl:
     return ScoresGatewayImpl(conn)
 
 
-def get_campaign_gateway(conn: Connection) -> CampaignGatewayImpl:
+def get_campaign_gateway(conn: LazyConnection) -> CampaignGatewayImpl:
     return CampaignGatewayImpl(conn)
 
 
-def get_time_gateway(conn: Connection) -> TimeGatewayImpl:
+def get_time_gateway(conn: LazyConnection) -> TimeGatewayImpl:
     return TimeGatewayImpl(conn)
 
 
-def get_actions_gateway(conn: Connection) -> ActionsGatewayImpl:
+def get_actions_gateway(conn: LazyConnection) -> ActionsGatewayImpl:
     return ActionsGatewayImpl(conn)
 
 
+def get_image_upload_gateway(conn: LazyConnection) -> ImageUploadGatewayImpl:
+    return ImageUploadGatewayImpl(conn)
+
+
+def get_stats_gateway(conn: ReplicaConnection) -> StatsGatewayImpl:
+    return StatsGatewayImpl(conn)
+
+
+def get_campaign_list_gateway(conn: ReplicaConnection) -> CampaignGatewayImpl:
+    return CampaignGatewayImpl(conn)
+
+
+def get_export_gateway(pool: ReplicaPool) -> ExportGatewayImpl:
+    return ExportGatewayImpl(pool)
+
+
 def get_db_provider() -> Provider:
     provider = Provider()
 
     provider.provide(get_db_config, scope=Scope.APP)
     provider.provide(get_db_pool, scope=Scope.APP)
+    provider.provide(get_replica_pool, scope=Scope.APP)
+    provider.provide(PoolMetrics, scope=Scope.APP)
+    provider.provide(get_replica_pool_metrics, scope=Scope.APP)
+    provider.provide(get_impression_buffer_config, scope=Scope.APP)
+    provider.provide(get_impression_buffer, scope=Scope.APP)
     provider.provide(get_db_connection, scope=Scope.REQUEST)
+    provider.provide(get_replica_connection, scope=Scope.REQUEST)
+    provider.provide(ReplicaRouter, scope=Scope.REQUEST)
     provider.provide(get_commiter, scope=Scope.REQUEST, provides=Commiter)
     provider.provide(get_client_gateway, scope=Scope.REQUEST, provides=ClientGateway)
     provider.provide(
@@ -87,5 +186,17 @@ def get_db_provider() -> Provider:
         provides=CampaignGateway,
     )
     provider.provide(get_actions_gateway, scope=Scope.REQUEST, provides=ActionsGateway)
+    provider.provide(
+        get_image_upload_gateway,
+        scope=Scope.REQUEST,
+        provides=ImageUploadGateway,
+    )
+    provider.provide(get_stats_gateway, scope=Scope.REQUEST, provides=StatsGateway)
+    provider.provide(
+        get_campaign_list_gateway,
+        scope=Scope.REQUEST,
+        provides=CampaignListGateway,
+    )
+    provider.provide(get_export_gateway, scope=Scope.REQUEST, provides=ExportGateway)
 
     return provider
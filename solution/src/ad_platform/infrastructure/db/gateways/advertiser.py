@@ -1,16 +1,19 @@
 import logging
 from typing import cast
 
-from asyncpg import Connection
-
 from ad_platform.domain.entities import Advertiser, AdvertiserId
+from ad_platform.infrastructure.db.commiter import CommiterError
+from ad_platform.infrastructure.db.connection import LazyConnection
 from ad_platform.infrastructure.db.gateways.common import AdvertiserGateway
 
 logger = logging.getLogger(__name__)
 
+# Пачки от этого размера пишутся через COPY, не построчно
+COPY_THRESHOLD = 1000
+
 
 class AdvertiserGatewayImpl(AdvertiserGateway):
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: LazyConnection) -> None:
         self.conn = conn
 
     async def get_advertiser(self, advertiser_id: AdvertiserId) -> Advertiser | None:
@@ -30,11 +33,11 @@ class AdvertiserGatewayImpl(AdvertiserGateway):
         )
 
     async def upsert_advertisers(self, advertisers: list[Advertiser]) -> None:
-        logger.info(
-            "Upserting %s advertisers: %s",
-            len(advertisers),
-            [x.advertiser_id for x in advertisers],
-        )
+        logger.info("Upserting %s advertisers", len(advertisers))
+
+        if len(advertisers) >= COPY_THRESHOLD:
+            await self.copy_advertisers(advertisers)
+            return
 
         await self.conn.executemany(
             """
@@ -45,3 +48,35 @@ class AdvertiserGatewayImpl(AdvertiserGateway):
             """,
             [(client.advertiser_id, client.name) for client in advertisers],
         )
+
+    # Только внутри транзакции Commiter, как и copy_clients
+    async def copy_advertisers(self, advertisers: list[Advertiser]) -> None:
+        if not self.conn.in_transaction():
+            msg = "COPY upsert requires an open transaction"
+            raise CommiterError(msg)
+
+        await self.conn.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS advertisers_staging (
+                seq BIGINT GENERATED ALWAYS AS IDENTITY,
+                advertiser_id UUID NOT NULL,
+                name VARCHAR(255) NOT NULL
+            ) ON COMMIT DELETE ROWS;
+            """,
+        )
+        await self.conn.copy_records_to_table(
+            "advertisers_staging",
+            records=[(x.advertiser_id, x.name) for x in advertisers],
+            columns=["advertiser_id", "name"],
+        )
+        await self.conn.execute(
+            """
+            INSERT INTO advertisers (advertiser_id, name)
+            SELECT DISTINCT ON (advertiser_id) advertiser_id, name
+            FROM advertisers_staging
+            ORDER BY advertiser_id, seq DESC
+            ON CONFLICT (advertiser_id)
+            DO UPDATE SET name = EXCLUDED.name
+            WHERE advertisers.name IS DISTINCT FROM EXCLUDED.name;
+            """,
+        )
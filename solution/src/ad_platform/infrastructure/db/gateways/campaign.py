@@ -1,6 +1,6 @@
 import logging
 
-from asyncpg import Connection
+from asyncpg import Record
 
 from ad_platform.domain.entities import (
     AdvertiserId,
@@ -10,13 +10,76 @@ from ad_platform.domain.entities import (
     ClientId,
     Gender,
 )
-from ad_platform.infrastructure.db.gateways.common import CampaignGateway
+from ad_platform.infrastructure.db.connection import LazyConnection
+from ad_platform.infrastructure.db.gateways.common import (
+    CampaignGateway,
+    CampaignListGateway,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class CampaignGatewayImpl(CampaignGateway):
-    def __init__(self, conn: Connection) -> None:
+def record_to_campaign(res: Record) -> Campaign:
+    return Campaign(
+        campaign_id=res["campaign_id"],
+        advertiser_id=res["advertiser_id"],
+        ad_title=res["ad_title"],
+        ad_text=res["ad_text"],
+        start_date=res["start_date"],
+        end_date=res["end_date"],
+        impressions_limit=res["impressions_limit"],
+        clicks_limit=res["clicks_limit"],
+        cost_per_impression=res["cost_per_impression"],
+        cost_per_click=res["cost_per_click"],
+        image_url=res["image_url"],
+        targeting=CampaignTarget(
+            age_from=res["age_from"],
+            age_to=res["age_to"],
+            gender=Gender[res["gender"]] if res["gender"] else None,
+            location=res["loc"],
+        ),
+    )
+
+
+# $4 - показы кандидатов, ещё не записанные в БД (см. ImpressionBuffer)
+TARGET_CAMPAIGN_QUERY = """
+SELECT c.*
+FROM unnest($1::uuid[], $2::float8[], $4::int[]) AS t (campaign_id, price_rank, pending)
+JOIN active_campaigns c ON c.campaign_id = t.campaign_id
+LEFT JOIN campaign_counters cnt ON cnt.campaign_id = c.campaign_id
+LEFT JOIN scores s ON s.advertiser_id = c.advertiser_id AND s.client_id = $3
+LEFT JOIN advertiser_score_max m ON m.advertiser_id = c.advertiser_id
+WHERE
+    (c.impressions_limit * 1.05) > COALESCE(cnt.impressions_count, 0) + t.pending
+    AND c.clicks_limit >= COALESCE(cnt.clicks_count, 0)
+    AND NOT EXISTS (
+        SELECT 1 FROM clicks cl
+        WHERE cl.client_id = $3 AND cl.campaign_id = c.campaign_id
+    )
+ORDER BY
+    (
+        t.price_rank
+        + 1.5 * COALESCE(s.score::float8 / NULLIF(m.max_score, 0), 0)
+    ) DESC
+LIMIT 1
+"""
+
+# Выбор кампании и запись показа одним запросом, без отдельной транзакции.
+# Подставляется только константа выше, пользовательских данных в запросе нет.
+SERVE_CAMPAIGN_QUERY = f"""
+WITH target AS (
+{TARGET_CAMPAIGN_QUERY}
+), shown AS (
+    INSERT INTO impressions (campaign_id, client_id, day, price)
+    SELECT campaign_id, $3, $5, cost_per_impression FROM target
+    ON CONFLICT DO NOTHING
+)
+SELECT * FROM target
+"""  # noqa: S608
+
+
+class CampaignGatewayImpl(CampaignGateway, CampaignListGateway):
+    def __init__(self, conn: LazyConnection) -> None:
         self.conn = conn
 
     async def create_campaign(self, campaign: Campaign) -> None:
@@ -161,14 +224,32 @@ class CampaignGatewayImpl(CampaignGateway):
         advertiser_id: AdvertiserId,
         page: int,
         size: int,
+        after: CampaignId | None = None,
     ) -> list[Campaign]:
-        logger.info("get_campaigns %s %s %s", advertiser_id, page, size)
-        res = await self.conn.fetch(
-            "SELECT * FROM active_campaigns WHERE advertiser_id = $1 LIMIT $2 OFFSET $3;",
-            advertiser_id,
-            size,
-            page * size,
-        )
+        logger.info("get_campaigns %s %s %s %s", advertiser_id, page, size, after)
+
+        if after is not None:
+            # Пагинация по курсору идёт по индексу (advertiser_id, campaign_id),
+            # страница стоит одинаково на любой глубине
+            res = await self.conn.fetch(
+                """SELECT * FROM active_campaigns
+                WHERE advertiser_id = $1 AND campaign_id > $2
+                ORDER BY campaign_id
+                LIMIT $3;""",
+                advertiser_id,
+                after,
+                size,
+            )
+        else:
+            res = await self.conn.fetch(
+                """SELECT * FROM active_campaigns
+                WHERE advertiser_id = $1
+                ORDER BY campaign_id
+                LIMIT $2 OFFSET $3;""",
+                advertiser_id,
+                size,
+                page * size,
+            )
 
         return [
             Campaign(
@@ -193,122 +274,67 @@ class CampaignGatewayImpl(CampaignGateway):
             for r in res
         ]
 
-    async def get_target_campaign(
+    async def get_active_campaigns(self) -> list[Campaign]:
+        res = await self.conn.fetch("SELECT * FROM active_campaigns;")
+
+        return [record_to_campaign(r) for r in res]
+
+    async def pick_campaign(
         self,
-        day: int,
-        gender: Gender,
-        age: int,
-        location: str,
         client_id: ClientId,
+        campaign_ids: list[CampaignId],
+        price_ranks: list[float],
+        pending_counts: list[int],
     ) -> Campaign | None:
-        logger.info("get_target_campaign %s %s %s %s", day, gender, age, location)
+        logger.info("pick_campaign %s among %s", client_id, len(campaign_ids))
         res = await self.conn.fetchrow(
-            """
-            WITH campaign_scores AS (
-                SELECT c.*,
-                    COALESCE(s.score, 0) AS score,
-                    (COALESCE(s.score, 0) / (SELECT MAX(score)
-                        FROM scores WHERE advertiser_id = c.advertiser_id))
-                    AS normalized_score,
-                    (COALESCE(c.cost_per_impression, 0) /
-                        (SELECT MAX(cost_per_impression)
-                            FROM active_campaigns WHERE cost_per_impression IS NOT NULL))
-                        AS normalized_price_per_impression,
-                    (COALESCE(c.cost_per_click, 0) /
-                        (SELECT MAX(cost_per_click)
-                            FROM active_campaigns WHERE cost_per_click IS NOT NULL))
-                        AS normalized_price_per_click
-                FROM active_campaigns c
-                LEFT JOIN scores s ON c.advertiser_id = s.advertiser_id
-                    AND (s.client_id = $5)
-                WHERE c.end_date >= $1
-                    AND c.start_date <= $1
-                    AND (c.gender = 'ALL' OR c.gender = $2)
-                    AND (c.age_from IS NULL OR c.age_from <= $3)
-                    AND (c.age_to IS NULL OR c.age_to >= $3)
-                    AND (c.loc IS NULL OR c.loc = $4)
-            ), ic AS (
-                SELECT
-                    campaign_id,
-                    COALESCE(COUNT(*), 0) AS impression_count
-                FROM
-                    impressions
-                WHERE
-                    campaign_id IN (SELECT campaign_id FROM campaign_scores)
-                GROUP BY
-                    campaign_id
-            ), cc AS (
-                SELECT
-                    campaign_id,
-                    COALESCE(COUNT(*), 0) AS click_count
-                FROM
-                    clicks
-                WHERE
-                    campaign_id IN (SELECT campaign_id FROM campaign_scores)
-                GROUP BY
-                    campaign_id
-            )
-            SELECT
-                cs.*,
-                COALESCE(impression_count, 0) AS impressions,
-                COALESCE(click_count, 0) AS clicks
-            FROM
-                campaign_scores cs
-            LEFT JOIN
-                ic  ON cs.campaign_id = ic.campaign_id
-            LEFT JOIN
-                cc ON cs.campaign_id = cc.campaign_id
-            WHERE
-                (cs.impressions_limit * 1.05) > COALESCE(impression_count, 0)
-                AND (cs.clicks_limit) >= COALESCE(click_count, 0)
-                AND (SELECT count(*) FROM clicks WHERE client_id = $5
-                    AND campaign_id = cs.campaign_id) = 0
-            ORDER BY
-                (
-                    2 * (cs.normalized_price_per_impression + 0.2 * cs.normalized_price_per_click)
-                    + 1.5 * cs.normalized_score
-                ) DESC
-            LIMIT 1
-            """,
-            day,
-            gender.value,
-            age,
-            location,
+            TARGET_CAMPAIGN_QUERY,
+            campaign_ids,
+            price_ranks,
             client_id,
+            pending_counts,
         )
 
-        logger.info("get_target_campaign %s", res)
+        logger.info("pick_campaign %s", res)
 
         if res is None:
             return None
 
-        return Campaign(
-            campaign_id=res["campaign_id"],
-            advertiser_id=res["advertiser_id"],
-            ad_title=res["ad_title"],
-            ad_text=res["ad_text"],
-            start_date=res["start_date"],
-            end_date=res["end_date"],
-            impressions_limit=res["impressions_limit"],
-            clicks_limit=res["clicks_limit"],
-            cost_per_impression=res["cost_per_impression"],
-            cost_per_click=res["cost_per_click"],
-            image_url=res["image_url"],
-            targeting=CampaignTarget(
-                age_from=res["age_from"],
-                age_to=res["age_to"],
-                gender=Gender[res["gender"]] if res["gender"] else None,
-                location=res["loc"],
-            ),
+        return record_to_campaign(res)
+
+    async def serve_campaign(
+        self,
+        client_id: ClientId,
+        day: int,
+        campaign_ids: list[CampaignId],
+        price_ranks: list[float],
+    ) -> Campaign | None:
+        logger.info("serve_campaign %s among %s", client_id, len(campaign_ids))
+        res = await self.conn.fetchrow(
+            SERVE_CAMPAIGN_QUERY,
+            campaign_ids,
+            price_ranks,
+            client_id,
+            [0] * len(campaign_ids),
+            day,
         )
 
+        logger.info("serve_campaign %s", res)
+
+        if res is None:
+            return None
+
+        return record_to_campaign(res)
+
     async def update_campaign_image(
         self,
         campaign_id: CampaignId,
-        image_url: str,
-    ) -> None:
-        await self.conn.execute(
+        image_url: str | None,
+    ) -> bool:
+        status = await self.conn.execute(
             "UPDATE active_campaigns SET image_url = $1 WHERE campaign_id = $2",
             image_url,
             campaign_id,
         )
+
+        return status == "UPDATE 1"
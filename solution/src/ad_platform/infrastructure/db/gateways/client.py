@@ -1,16 +1,19 @@
 import logging
 from typing import cast
 
-from asyncpg import Connection
-
 from ad_platform.domain.entities import Client, ClientGender, ClientId
+from ad_platform.infrastructure.db.commiter import CommiterError
+from ad_platform.infrastructure.db.connection import LazyConnection
 from ad_platform.infrastructure.db.gateways.common import ClientGateway
 
 logger = logging.getLogger(__name__)
 
+# Пачки от этого размера пишутся через COPY, не построчно
+COPY_THRESHOLD = 1000
+
 
 class ClientGatewayImpl(ClientGateway):
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: LazyConnection) -> None:
         self.conn = conn
 
     async def get_client(self, client_id: ClientId) -> Client | None:
@@ -33,11 +36,11 @@ class ClientGatewayImpl(ClientGateway):
         )
 
     async def upsert_clients(self, clients: list[Client]) -> None:
-        logger.info(
-            "Upserting %s clients: %s",
-            len(clients),
-            [x.client_id for x in clients],
-        )
+        logger.info("Upserting %s clients", len(clients))
+
+        if len(clients) >= COPY_THRESHOLD:
+            await self.copy_clients(clients)
+            return
 
         await self.conn.executemany(
             """
@@ -61,3 +64,55 @@ class ClientGatewayImpl(ClientGateway):
                 for client in clients
             ],
         )
+
+    # Только внутри транзакции Commiter: временная таблица живёт на
+    # соединении, строки из неё удаляются при коммите
+    async def copy_clients(self, clients: list[Client]) -> None:
+        if not self.conn.in_transaction():
+            msg = "COPY upsert requires an open transaction"
+            raise CommiterError(msg)
+
+        await self.conn.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS clients_staging (
+                seq BIGINT GENERATED ALWAYS AS IDENTITY,
+                client_id UUID NOT NULL,
+                login VARCHAR(255) NOT NULL,
+                age INTEGER NOT NULL,
+                loc VARCHAR(511) NOT NULL,
+                gender VARCHAR(6) NOT NULL
+            ) ON COMMIT DELETE ROWS;
+            """,
+        )
+        await self.conn.copy_records_to_table(
+            "clients_staging",
+            records=[
+                (
+                    client.client_id,
+                    client.login,
+                    client.age,
+                    client.location,
+                    client.gender.value,
+                )
+                for client in clients
+            ],
+            columns=["client_id", "login", "age", "loc", "gender"],
+        )
+        # При повторе id побеждает последняя запись, как и при построчной вставке
+        await self.conn.execute(
+            """
+            INSERT INTO clients (client_id, login, age, loc, gender)
+            SELECT DISTINCT ON (client_id) client_id, login, age, loc, gender
+            FROM clients_staging
+            ORDER BY client_id, seq DESC
+            ON CONFLICT (client_id)
+            DO UPDATE SET
+                login = EXCLUDED.login,
+                age = EXCLUDED.age,
+                loc = EXCLUDED.loc,
+                gender = EXCLUDED.gender
+            WHERE (clients.login, clients.age, clients.loc, clients.gender)
+                IS DISTINCT FROM
+                (EXCLUDED.login, EXCLUDED.age, EXCLUDED.loc, EXCLUDED.gender);
+            """,
+        )
@@ -1,16 +1,19 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Protocol
+from uuid import UUID
 
 from ad_platform.domain.entities import (
     Advertiser,
     AdvertiserId,
     Campaign,
     CampaignId,
-    Click,
+    CampaignStats,
+    ClickResult,
     Client,
-    ClientGender,
     ClientId,
-    Impression,
+    DayRange,
+    Event,
     Score,
     Stats,
 )
@@ -36,6 +39,30 @@ class AdvertiserGateway(Protocol):
 class ScoresGateway(Protocol):
     @abstractmethod
     async def upsert_score(self, score: Score) -> None: ...
+    @abstractmethod
+    async def stage_scores(self, load_id: UUID, scores: list[Score]) -> None: ...
+    @abstractmethod
+    async def get_staged_missing_clients(self, load_id: UUID) -> list[ClientId]: ...
+    @abstractmethod
+    async def get_staged_missing_advertisers(
+        self,
+        load_id: UUID,
+    ) -> list[AdvertiserId]: ...
+    @abstractmethod
+    async def merge_staged_scores(self, load_id: UUID) -> int: ...
+    @abstractmethod
+    async def discard_staged_scores(self, load_id: UUID) -> None: ...
+
+
+class CampaignListGateway(Protocol):
+    @abstractmethod
+    async def get_campaigns(
+        self,
+        advertiser_id: AdvertiserId,
+        page: int,
+        size: int,
+        after: CampaignId | None = None,
+    ) -> list[Campaign]: ...
 
 
 class CampaignGateway(Protocol):
@@ -48,6 +75,7 @@ class CampaignGateway(Protocol):
         advertiser_id: AdvertiserId,
         page: int,
         size: int,
+        after: CampaignId | None = None,
     ) -> list[Campaign]: ...
 
     @abstractmethod
@@ -60,16 +88,25 @@ class CampaignGateway(Protocol):
     async def update_campaign_image(
         self,
         campaign_id: CampaignId,
-        image_url: str,
-    ) -> None: ...
+        image_url: str | None,
+    ) -> bool: ...
+    @abstractmethod
+    async def get_active_campaigns(self) -> list[Campaign]: ...
     @abstractmethod
-    async def get_target_campaign(
+    async def pick_campaign(
+        self,
+        client_id: ClientId,
+        campaign_ids: list[CampaignId],
+        price_ranks: list[float],
+        pending_counts: list[int],
+    ) -> Campaign | None: ...
+    @abstractmethod
+    async def serve_campaign(
         self,
-        day: int,
-        gender: ClientGender,
-        age: int,
-        location: str,
         client_id: ClientId,
+        day: int,
+        campaign_ids: list[CampaignId],
+        price_ranks: list[float],
     ) -> Campaign | None: ...
     @abstractmethod
     async def get_campaign_deleted(
@@ -78,6 +115,13 @@ class CampaignGateway(Protocol):
     ) -> Campaign | None: ...
 
 
+class ImageUploadGateway(Protocol):
+    @abstractmethod
+    async def add_upload(self, image_id: str, campaign_id: CampaignId) -> None: ...
+    @abstractmethod
+    async def remove_upload(self, image_id: str) -> None: ...
+
+
 class TimeGateway(Protocol):
     @abstractmethod
     async def get_time(self) -> int: ...
@@ -87,32 +131,43 @@ class TimeGateway(Protocol):
 
 class ActionsGateway(Protocol):
     @abstractmethod
-    async def create_impression(self, impression: Impression) -> None: ...
-    @abstractmethod
-    async def create_click(self, click: Click) -> None: ...
-    @abstractmethod
-    async def get_impression(
-        self,
-        campaign_id: CampaignId,
-        client_id: ClientId,
-    ) -> Impression | None: ...
-    @abstractmethod
-    async def get_click(
+    async def click(
         self,
         campaign_id: CampaignId,
         client_id: ClientId,
-    ) -> Click | None: ...
+        day: int,
+    ) -> ClickResult: ...
+
+
+class StatsGateway(Protocol):
     @abstractmethod
     async def get_campaign_stats(self, campaign_id: CampaignId) -> Stats: ...
     @abstractmethod
+    async def get_campaigns_stats(
+        self,
+        campaign_ids: list[CampaignId],
+    ) -> list[CampaignStats]: ...
+    @abstractmethod
     async def get_advertiser_stats(self, advertiser_id: AdvertiserId) -> Stats: ...
     @abstractmethod
     async def get_campaign_daily_stats(
         self,
         campaign_id: CampaignId,
+        day_range: DayRange,
     ) -> list[Stats]: ...
     @abstractmethod
     async def get_advertiser_daily_stats(
         self,
         advertiser_id: AdvertiserId,
+        day_range: DayRange,
     ) -> list[Stats]: ...
+
+
+class ExportGateway(Protocol):
+    @abstractmethod
+    def iter_events(
+        self,
+        advertiser_id: AdvertiserId,
+        campaign_id: CampaignId | None,
+        day_range: DayRange,
+    ) -> AsyncIterator[Event]: ...
@@ -0,0 +1,62 @@
+from collections.abc import AsyncIterator
+
+from ad_platform.domain.entities import (
+    AdvertiserId,
+    CampaignId,
+    DayRange,
+    Event,
+    EventType,
+)
+from ad_platform.infrastructure.db.connection import ReplicaPool
+from ad_platform.infrastructure.db.gateways.common import ExportGateway
+from ad_platform.infrastructure.db.gateways.stats import day_bounds
+
+# Сколько строк курсор забирает из БД за один раз
+EXPORT_PREFETCH = 1000
+
+EVENTS_QUERY = """SELECT 'impression' AS event, campaign_id, client_id, day, price
+FROM impressions
+WHERE campaign_id = ANY(ARRAY(
+        SELECT campaign_id FROM campaigns
+        WHERE advertiser_id = $1 AND ($2::uuid IS NULL OR campaign_id = $2)
+    ))
+    AND day BETWEEN $3 AND $4
+UNION ALL
+SELECT 'click' AS event, campaign_id, client_id, day, price
+FROM clicks
+WHERE campaign_id = ANY(ARRAY(
+        SELECT campaign_id FROM campaigns
+        WHERE advertiser_id = $1 AND ($2::uuid IS NULL OR campaign_id = $2)
+    ))
+    AND day BETWEEN $3 AND $4"""
+
+
+# Выгрузка идёт серверным курсором на отдельном соединении, которое живёт
+# только пока читается поток, независимо от обработки запроса.
+class ExportGatewayImpl(ExportGateway):
+    def __init__(self, pool: ReplicaPool) -> None:
+        self.pool = pool
+
+    async def iter_events(
+        self,
+        advertiser_id: AdvertiserId,
+        campaign_id: CampaignId | None,
+        day_range: DayRange,
+    ) -> AsyncIterator[Event]:
+        async with self.pool.acquire() as conn, conn.transaction(readonly=True):
+            cursor = conn.cursor(
+                EVENTS_QUERY,
+                advertiser_id,
+                campaign_id,
+                *day_bounds(day_range),
+                prefetch=EXPORT_PREFETCH,
+            )
+
+            async for res in cursor:
+                yield Event(
+                    event=EventType(res["event"]),
+                    campaign_id=res["campaign_id"],
+                    client_id=res["client_id"],
+                    day=res["day"],
+                    price=res["price"],
+                )
@@ -0,0 +1,21 @@
+from ad_platform.domain.entities import CampaignId
+from ad_platform.infrastructure.db.connection import LazyConnection
+from ad_platform.infrastructure.db.gateways.common import ImageUploadGateway
+
+
+class ImageUploadGatewayImpl(ImageUploadGateway):
+    def __init__(self, conn: LazyConnection) -> None:
+        self.conn = conn
+
+    async def add_upload(self, image_id: str, campaign_id: CampaignId) -> None:
+        await self.conn.execute(
+            "INSERT INTO image_uploads (image_id, campaign_id) VALUES ($1, $2)",
+            image_id,
+            campaign_id,
+        )
+
+    async def remove_upload(self, image_id: str) -> None:
+        await self.conn.execute(
+            "DELETE FROM image_uploads WHERE image_id = $1",
+            image_id,
+        )
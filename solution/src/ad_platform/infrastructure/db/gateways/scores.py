@@ -1,15 +1,18 @@
 import logging
+from uuid import UUID
 
-from asyncpg import Connection
-
-from ad_platform.domain.entities import Score
+from ad_platform.domain.entities import AdvertiserId, ClientId, Score
+from ad_platform.infrastructure.db.connection import LazyConnection
 from ad_platform.infrastructure.db.gateways.common import ScoresGateway
 
 logger = logging.getLogger(__name__)
 
+# Сколько ненайденных id попадает в текст ошибки
+MISSING_REFS_LIMIT = 10
+
 
 class ScoresGatewayImpl(ScoresGateway):
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: LazyConnection) -> None:
         self.conn = conn
 
     async def upsert_score(self, score: Score) -> None:
@@ -26,3 +29,77 @@ class ScoresGatewayImpl(ScoresGateway):
             score.advertiser_id,
             score.score,
         )
+
+    # Массовая загрузка копится в scores_uploads под своим load_id: каждая
+    # пачка пишется отдельным COPY вне транзакции, проверка внешних ключей и
+    # слияние идут одной короткой транзакцией в конце.
+    async def stage_scores(self, load_id: UUID, scores: list[Score]) -> None:
+        await self.conn.copy_records_to_table(
+            "scores_uploads",
+            records=[(load_id, s.client_id, s.advertiser_id, s.score) for s in scores],
+            columns=["load_id", "client_id", "advertiser_id", "score"],
+        )
+
+    async def get_staged_missing_clients(self, load_id: UUID) -> list[ClientId]:
+        res = await self.conn.fetch(
+            """
+            SELECT DISTINCT s.client_id
+            FROM scores_uploads s
+            WHERE s.load_id = $1
+                AND NOT EXISTS (SELECT 1 FROM clients c WHERE c.client_id = s.client_id)
+            LIMIT $2;
+            """,
+            load_id,
+            MISSING_REFS_LIMIT,
+        )
+
+        return [r["client_id"] for r in res]
+
+    async def get_staged_missing_advertisers(
+        self,
+        load_id: UUID,
+    ) -> list[AdvertiserId]:
+        res = await self.conn.fetch(
+            """
+            SELECT DISTINCT s.advertiser_id
+            FROM scores_uploads s
+            WHERE s.load_id = $1
+                AND NOT EXISTS (
+                    SELECT 1 FROM advertisers a WHERE a.advertiser_id = s.advertiser_id
+                )
+            LIMIT $2;
+            """,
+            load_id,
+            MISSING_REFS_LIMIT,
+        )
+
+        return [r["advertiser_id"] for r in res]
+
+    async def merge_staged_scores(self, load_id: UUID) -> int:
+        # При повторе пары побеждает последний скор, неизменённые скоры не
+        # перезаписываются, чтобы не дёргать триггер advertiser_score_max
+        status = await self.conn.execute(
+            """
+            INSERT INTO scores (client_id, advertiser_id, score)
+            SELECT DISTINCT ON (client_id, advertiser_id) client_id, advertiser_id, score
+            FROM scores_uploads
+            WHERE load_id = $1
+            ORDER BY client_id, advertiser_id, seq DESC
+            ON CONFLICT (client_id, advertiser_id)
+            DO UPDATE SET score = EXCLUDED.score
+            WHERE scores.score IS DISTINCT FROM EXCLUDED.score;
+            """,
+            load_id,
+        )
+
+        return int(status.split()[-1])
+
+    async def discard_staged_scores(self, load_id: UUID) -> None:
+        # Заодно удаляются пачки загрузок, оборванных падением процесса
+        await self.conn.execute(
+            """
+            DELETE FROM scores_uploads
+            WHERE load_id = $1 OR created_at < now() - interval '1 day';
+            """,
+            load_id,
+        )
@@ -0,0 +1,163 @@
+from ad_platform.domain.entities import (
+    AdvertiserId,
+    CampaignId,
+    CampaignStats,
+    DailyStats,
+    DayRange,
+    Stats,
+)
+from ad_platform.infrastructure.db.connection import LazyConnection
+from ad_platform.infrastructure.db.gateways.common import StatsGateway
+
+# Итоговые поля статистики считаются в запросе, строки сразу
+# раскладываются в сущности без промежуточных словарей.
+STATS_COLUMNS = """impressions_count,
+    clicks_count,
+    CASE WHEN impressions_count = 0 THEN 0
+        ELSE clicks_count::float8 / impressions_count
+    END AS conversion,
+    spent_impressions,
+    spent_clicks,
+    spent_impressions + spent_clicks AS spent_total"""
+
+MAX_DAY = 2**63 - 1
+
+
+def stats_query(columns: str, source: str) -> str:
+    # Подставляются только константы этого модуля, параметры идут через $n
+    return f"SELECT {STATS_COLUMNS}{columns} FROM {source}"  # noqa: S608
+
+
+CAMPAIGN_STATS_QUERY = stats_query(
+    "",
+    """(
+        SELECT
+            COALESCE(SUM(impressions_count), 0) AS impressions_count,
+            COALESCE(SUM(clicks_count), 0) AS clicks_count,
+            COALESCE(SUM(spent_impressions), 0) AS spent_impressions,
+            COALESCE(SUM(spent_clicks), 0) AS spent_clicks
+        FROM campaign_daily_stats
+        WHERE campaign_id = $1
+    ) s""",
+)
+
+# Несуществующих кампаний нет в ответе
+CAMPAIGNS_STATS_QUERY = stats_query(
+    ", campaign_id",
+    """(
+        SELECT
+            c.campaign_id,
+            COALESCE(SUM(s.impressions_count), 0) AS impressions_count,
+            COALESCE(SUM(s.clicks_count), 0) AS clicks_count,
+            COALESCE(SUM(s.spent_impressions), 0) AS spent_impressions,
+            COALESCE(SUM(s.spent_clicks), 0) AS spent_clicks
+        FROM campaigns c
+        LEFT JOIN campaign_daily_stats s ON s.campaign_id = c.campaign_id
+        WHERE c.campaign_id = ANY($1::uuid[])
+        GROUP BY c.campaign_id
+    ) s""",
+)
+
+ADVERTISER_STATS_QUERY = stats_query(
+    "",
+    """(
+        SELECT
+            COALESCE(SUM(impressions_count), 0) AS impressions_count,
+            COALESCE(SUM(clicks_count), 0) AS clicks_count,
+            COALESCE(SUM(spent_impressions), 0) AS spent_impressions,
+            COALESCE(SUM(spent_clicks), 0) AS spent_clicks
+        FROM advertiser_stats
+        WHERE advertiser_id = $1
+    ) s""",
+)
+
+CAMPAIGN_DAILY_STATS_QUERY = stats_query(
+    ", day AS date",
+    """campaign_daily_stats
+    WHERE campaign_id = $1 AND day BETWEEN $2 AND $3
+    ORDER BY day
+    LIMIT $4""",
+)
+
+ADVERTISER_DAILY_STATS_QUERY = stats_query(
+    ", day AS date",
+    """(
+        SELECT
+            day,
+            SUM(impressions_count) AS impressions_count,
+            SUM(clicks_count) AS clicks_count,
+            SUM(spent_impressions) AS spent_impressions,
+            SUM(spent_clicks) AS spent_clicks
+        FROM campaign_daily_stats
+        WHERE campaign_id = ANY(ARRAY(
+            SELECT campaign_id FROM campaigns WHERE advertiser_id = $1
+        ))
+            AND day BETWEEN $2 AND $3
+        GROUP BY day
+    ) s
+    ORDER BY day
+    LIMIT $4""",
+)
+
+
+def day_bounds(day_range: DayRange) -> tuple[int, int]:
+    from_day = day_range.from_day
+    if day_range.after is not None:
+        from_day = max(from_day, day_range.after + 1)
+
+    to_day = MAX_DAY if day_range.to_day is None else day_range.to_day
+
+    return from_day, to_day
+
+
+# Статистика читается из campaign_daily_stats и advertiser_stats, которые
+# ведут триггеры на impressions и clicks.
+class StatsGatewayImpl(StatsGateway):
+    def __init__(self, conn: LazyConnection) -> None:
+        self.conn = conn
+
+    async def get_campaign_stats(self, campaign_id: CampaignId) -> Stats:
+        res = await self.conn.fetchrow(CAMPAIGN_STATS_QUERY, campaign_id)
+
+        return Stats(**res)
+
+    async def get_campaigns_stats(
+        self,
+        campaign_ids: list[CampaignId],
+    ) -> list[CampaignStats]:
+        res = await self.conn.fetch(CAMPAIGNS_STATS_QUERY, campaign_ids)
+
+        return [CampaignStats(**r) for r in res]
+
+    async def get_advertiser_stats(self, advertiser_id: AdvertiserId) -> Stats:
+        res = await self.conn.fetchrow(ADVERTISER_STATS_QUERY, advertiser_id)
+
+        return Stats(**res)
+
+    async def get_campaign_daily_stats(
+        self,
+        campaign_id: CampaignId,
+        day_range: DayRange,
+    ) -> list[DailyStats]:
+        res = await self.conn.fetch(
+            CAMPAIGN_DAILY_STATS_QUERY,
+            campaign_id,
+            *day_bounds(day_range),
+            day_range.limit,
+        )
+
+        return [DailyStats(**r) for r in res]
+
+    async def get_advertiser_daily_stats(
+        self,
+        advertiser_id: AdvertiserId,
+        day_range: DayRange,
+    ) -> list[DailyStats]:
+        res = await self.conn.fetch(
+            ADVERTISER_DAILY_STATS_QUERY,
+            advertiser_id,
+            *day_bounds(day_range),
+            day_range.limit,
+        )
+
+        return [DailyStats(**r) for r in res]
@@ -1,10 +1,9 @@
-from asyncpg import Connection
-
+from ad_platform.infrastructure.db.connection import LazyConnection
 from ad_platform.infrastructure.db.gateways.common import TimeGateway
 
 
 class TimeGatewayImpl(TimeGateway):
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: LazyConnection) -> None:
         self.conn = conn
 
     async def get_time(self) -> int:
@@ -0,0 +1,161 @@
+import asyncio
+import contextlib
+import logging
+from collections import Counter, deque
+
+from asyncpg import Pool
+
+from ad_platform.domain.entities import CampaignId, ClientId, Impression
+from ad_platform.infrastructure.db.config import ImpressionBufferConfig
+
+logger = logging.getLogger(__name__)
+
+
+# Буфер показов: показы копятся в памяти процесса и пачками пишутся в БД
+# фоновой задачей. Пока показ не записан, он учитывается в pending_counts,
+# чтобы он учитывался при проверке лимитов кампаний.
+class ImpressionBuffer:
+    def __init__(self, pool: Pool, config: ImpressionBufferConfig) -> None:
+        self.pool = pool
+        self.config = config
+        self.enabled = config.enabled
+        self.queue: deque[Impression] = deque()
+        self.pending: set[tuple[CampaignId, ClientId]] = set()
+        self.pending_counts: Counter[CampaignId] = Counter()
+        self.not_full = asyncio.Condition()
+        self.batch_ready = asyncio.Event()
+        self.flush_lock = asyncio.Lock()
+        self.failures = 0
+        self.task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self.enabled:
+            self.task = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        if self.task is None:
+            return
+
+        self.task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.task
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Lost %s buffered impressions", len(self.pending))
+
+    def is_pending(self, campaign_id: CampaignId, client_id: ClientId) -> bool:
+        return (campaign_id, client_id) in self.pending
+
+    async def put(self, impression: Impression) -> None:
+        key = (impression.campaign_id, impression.client_id)
+
+        async with self.not_full:
+            await self.not_full.wait_for(
+                lambda: len(self.queue) < self.config.max_size,
+            )
+
+            # Повторный показ той же пары всё равно не будет записан
+            if key in self.pending:
+                return
+
+            self.queue.append(impression)
+            self.pending.add(key)
+            self.pending_counts[impression.campaign_id] += 1
+
+        if len(self.queue) >= self.config.batch_size:
+            self.batch_ready.set()
+
+    async def run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self.batch_ready.wait(),
+                    timeout=self.config.flush_interval,
+                )
+
+            self.batch_ready.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Impressions flush failed, will retry")
+
+    async def flush(self) -> None:
+        async with self.flush_lock:
+            while self.queue:
+                size = min(len(self.queue), self.config.batch_size)
+                batch = [self.queue.popleft() for _ in range(size)]
+
+                try:
+                    await self.write(batch)
+                except Exception:
+                    self.failures += 1
+                    if self.failures < self.config.max_retries:
+                        self.queue.extendleft(reversed(batch))
+                        raise
+
+                    # Пачка не пишется несколько раз подряд: пишем показы по
+                    # одному, чтобы одна битая строка не держала всю очередь.
+                    await self.write_each(batch)
+
+                self.failures = 0
+
+                async with self.not_full:
+                    for impression in batch:
+                        self.pending.discard(
+                            (impression.campaign_id, impression.client_id),
+                        )
+                        self.pending_counts[impression.campaign_id] -= 1
+                        if not self.pending_counts[impression.campaign_id]:
+                            del self.pending_counts[impression.campaign_id]
+
+                    self.not_full.notify_all()
+
+                logger.debug("Flushed %s impressions", len(batch))
+
+    async def write_each(self, batch: list[Impression]) -> None:
+        dropped = 0
+        for impression in batch:
+            if not await self.write_one(impression):
+                dropped += 1
+
+        if dropped:
+            logger.error("Dropped %s impressions that failed to write", dropped)
+
+    async def write_one(self, impression: Impression) -> bool:
+        try:
+            await self.write([impression])
+        except Exception:
+            logger.exception("Failed to write impression %s", impression)
+            return False
+
+        return True
+
+    async def write(self, batch: list[Impression]) -> None:
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS impressions_staging (
+                    campaign_id UUID,
+                    client_id UUID,
+                    day BIGINT,
+                    price FLOAT
+                ) ON COMMIT DELETE ROWS;
+                """,
+            )
+            await conn.copy_records_to_table(
+                "impressions_staging",
+                records=[
+                    (i.campaign_id, i.client_id, i.day, i.price) for i in batch
+                ],
+                columns=["campaign_id", "client_id", "day", "price"],
+            )
+            await conn.execute(
+                """
+                INSERT INTO impressions (campaign_id, client_id, day, price)
+                SELECT campaign_id, client_id, day, price FROM impressions_staging
+                ON CONFLICT DO NOTHING;
+                """,
+            )
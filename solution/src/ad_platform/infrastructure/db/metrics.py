@@ -0,0 +1,46 @@
+import time
+from typing import Any, NewType
+
+from asyncpg import Connection, Pool
+
+
+# Метрики ожидания соединений из пула
+class PoolMetrics:
+    def __init__(self) -> None:
+        self.acquires = 0
+        self.acquired = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    async def acquire(self, pool: Pool) -> Connection:
+        start = time.perf_counter()
+        conn = await pool.acquire()
+        wait = time.perf_counter() - start
+
+        self.acquires += 1
+        self.acquired += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+        return conn
+
+    async def release(self, pool: Pool, conn: Connection) -> None:
+        self.acquired -= 1
+        await pool.release(conn)
+
+    def stats(self, pool: Pool) -> dict[str, Any]:
+        return {
+            "size": pool.get_size(),
+            "idle": pool.get_idle_size(),
+            "min_size": pool.get_min_size(),
+            "max_size": pool.get_max_size(),
+            "acquired": self.acquired,
+            "acquires": self.acquires,
+            "wait_total": self.wait_total,
+            "wait_max": self.wait_max,
+            "wait_avg": self.wait_total / self.acquires if self.acquires else 0,
+        }
+
+
+# Метрики пула реплики; если реплика не настроена, это метрики основного пула
+ReplicaPoolMetrics = NewType("ReplicaPoolMetrics", PoolMetrics)
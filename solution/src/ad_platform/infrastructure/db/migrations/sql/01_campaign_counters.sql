@@ -0,0 +1,68 @@
+CREATE TABLE campaign_counters (
+    campaign_id UUID NOT NULL PRIMARY KEY,
+    impressions_count INTEGER NOT NULL DEFAULT 0,
+    clicks_count INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT fk_campaign_counters_campaign FOREIGN KEY (campaign_id) REFERENCES campaigns (campaign_id) ON DELETE CASCADE
+);
+
+CREATE FUNCTION count_impressions() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO campaign_counters (campaign_id, impressions_count)
+    SELECT campaign_id, COUNT(*)
+    FROM new_impressions
+    GROUP BY campaign_id
+    ORDER BY campaign_id
+    ON CONFLICT (campaign_id)
+    DO UPDATE SET impressions_count = campaign_counters.impressions_count + EXCLUDED.impressions_count;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION count_clicks() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO campaign_counters (campaign_id, clicks_count)
+    SELECT campaign_id, COUNT(*)
+    FROM new_clicks
+    GROUP BY campaign_id
+    ORDER BY campaign_id
+    ON CONFLICT (campaign_id)
+    DO UPDATE SET clicks_count = campaign_counters.clicks_count + EXCLUDED.clicks_count;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER impressions_counters
+AFTER INSERT ON impressions
+REFERENCING NEW TABLE AS new_impressions
+FOR EACH STATEMENT EXECUTE FUNCTION count_impressions();
+
+CREATE TRIGGER clicks_counters
+AFTER INSERT ON clicks
+REFERENCING NEW TABLE AS new_clicks
+FOR EACH STATEMENT EXECUTE FUNCTION count_clicks();
+
+-- Пересчёт счётчиков из сырых таблиц, используется reconcile-джобой.
+CREATE FUNCTION rebuild_counters() RETURNS VOID AS $$
+BEGIN
+    LOCK TABLE impressions, clicks IN SHARE MODE;
+
+    DELETE FROM campaign_counters;
+
+    INSERT INTO campaign_counters (campaign_id, impressions_count, clicks_count)
+    SELECT campaign_id, SUM(impressions_count), SUM(clicks_count)
+    FROM (
+        SELECT campaign_id, COUNT(*) AS impressions_count, 0 AS clicks_count
+        FROM impressions
+        GROUP BY campaign_id
+        UNION ALL
+        SELECT campaign_id, 0, COUNT(*)
+        FROM clicks
+        GROUP BY campaign_id
+    ) AS counts
+    GROUP BY campaign_id;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rebuild_counters();
@@ -0,0 +1,54 @@
+CREATE TABLE advertiser_score_max (
+    advertiser_id UUID NOT NULL PRIMARY KEY,
+    max_score INTEGER NOT NULL,
+    CONSTRAINT fk_advertiser_score_max_advertiser FOREIGN KEY (advertiser_id) REFERENCES advertisers (advertiser_id) ON DELETE CASCADE
+);
+
+CREATE FUNCTION recompute_score_max(advertiser UUID) RETURNS VOID AS $$
+BEGIN
+    DELETE FROM advertiser_score_max WHERE advertiser_id = advertiser;
+
+    INSERT INTO advertiser_score_max (advertiser_id, max_score)
+    SELECT advertiser_id, MAX(score)
+    FROM scores
+    WHERE advertiser_id = advertiser
+    GROUP BY advertiser_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION track_score_max() RETURNS TRIGGER AS $$
+BEGIN
+    -- Полный пересчёт нужен только если уменьшился или пропал текущий максимум.
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.score < OLD.score) THEN
+        IF EXISTS (
+            SELECT 1 FROM advertiser_score_max
+            WHERE advertiser_id = OLD.advertiser_id AND max_score <= OLD.score
+        ) THEN
+            PERFORM recompute_score_max(OLD.advertiser_id);
+        END IF;
+
+        RETURN NULL;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM advertiser_score_max
+        WHERE advertiser_id = NEW.advertiser_id AND max_score >= NEW.score
+    ) THEN
+        INSERT INTO advertiser_score_max (advertiser_id, max_score)
+        VALUES (NEW.advertiser_id, NEW.score)
+        ON CONFLICT (advertiser_id)
+        DO UPDATE SET max_score = GREATEST(advertiser_score_max.max_score, EXCLUDED.max_score);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER scores_max
+AFTER INSERT OR UPDATE OF score OR DELETE ON scores
+FOR EACH ROW EXECUTE FUNCTION track_score_max();
+
+INSERT INTO advertiser_score_max (advertiser_id, max_score)
+SELECT advertiser_id, MAX(score)
+FROM scores
+GROUP BY advertiser_id;
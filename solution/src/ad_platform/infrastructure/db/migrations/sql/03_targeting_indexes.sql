@@ -0,0 +1,11 @@
+-- Статистика и проверки лимитов выбирают события по кампании, а уникальный
+-- индекс (client_id, campaign_id) для этого не подходит.
+CREATE INDEX impressions_campaign_id_idx ON impressions (campaign_id);
+CREATE INDEX clicks_campaign_id_idx ON clicks (campaign_id);
+
+-- Статистика по рекламодателю учитывает и удалённые кампании.
+CREATE INDEX campaigns_advertiser_id_idx ON campaigns (advertiser_id);
+
+-- Список кампаний рекламодателя работает только с неудалёнными кампаниями.
+CREATE INDEX active_campaigns_advertiser_id_idx ON campaigns (advertiser_id, campaign_id)
+WHERE is_deleted = FALSE;
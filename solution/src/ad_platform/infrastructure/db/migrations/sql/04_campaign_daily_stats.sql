@@ -0,0 +1,98 @@
+CREATE TABLE campaign_daily_stats (
+    campaign_id UUID NOT NULL,
+    day BIGINT NOT NULL,
+    impressions_count INTEGER NOT NULL DEFAULT 0,
+    clicks_count INTEGER NOT NULL DEFAULT 0,
+    spent_impressions FLOAT NOT NULL DEFAULT 0,
+    spent_clicks FLOAT NOT NULL DEFAULT 0,
+    PRIMARY KEY (campaign_id, day),
+    CONSTRAINT fk_campaign_daily_stats_campaign FOREIGN KEY (campaign_id) REFERENCES campaigns (campaign_id) ON DELETE CASCADE
+);
+
+CREATE FUNCTION rollup_impressions() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO campaign_daily_stats (campaign_id, day, impressions_count, spent_impressions)
+    SELECT campaign_id, day, COUNT(*), SUM(price)
+    FROM new_impressions
+    GROUP BY campaign_id, day
+    ORDER BY campaign_id, day
+    ON CONFLICT (campaign_id, day)
+    DO UPDATE SET
+        impressions_count = campaign_daily_stats.impressions_count + EXCLUDED.impressions_count,
+        spent_impressions = campaign_daily_stats.spent_impressions + EXCLUDED.spent_impressions;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION rollup_clicks() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO campaign_daily_stats (campaign_id, day, clicks_count, spent_clicks)
+    SELECT campaign_id, day, COUNT(*), SUM(price)
+    FROM new_clicks
+    GROUP BY campaign_id, day
+    ORDER BY campaign_id, day
+    ON CONFLICT (campaign_id, day)
+    DO UPDATE SET
+        clicks_count = campaign_daily_stats.clicks_count + EXCLUDED.clicks_count,
+        spent_clicks = campaign_daily_stats.spent_clicks + EXCLUDED.spent_clicks;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER impressions_daily_stats
+AFTER INSERT ON impressions
+REFERENCING NEW TABLE AS new_impressions
+FOR EACH STATEMENT EXECUTE FUNCTION rollup_impressions();
+
+CREATE TRIGGER clicks_daily_stats
+AFTER INSERT ON clicks
+REFERENCING NEW TABLE AS new_clicks
+FOR EACH STATEMENT EXECUTE FUNCTION rollup_clicks();
+
+-- Дневная статистика пересчитывается вместе со счётчиками.
+CREATE OR REPLACE FUNCTION rebuild_counters() RETURNS VOID AS $$
+BEGIN
+    LOCK TABLE impressions, clicks IN SHARE MODE;
+
+    DELETE FROM campaign_counters;
+
+    INSERT INTO campaign_counters (campaign_id, impressions_count, clicks_count)
+    SELECT campaign_id, SUM(impressions_count), SUM(clicks_count)
+    FROM (
+        SELECT campaign_id, COUNT(*) AS impressions_count, 0 AS clicks_count
+        FROM impressions
+        GROUP BY campaign_id
+        UNION ALL
+        SELECT campaign_id, 0, COUNT(*)
+        FROM clicks
+        GROUP BY campaign_id
+    ) AS counts
+    GROUP BY campaign_id;
+
+    DELETE FROM campaign_daily_stats;
+
+    INSERT INTO campaign_daily_stats (
+        campaign_id,
+        day,
+        impressions_count,
+        clicks_count,
+        spent_impressions,
+        spent_clicks
+    )
+    SELECT campaign_id, day, SUM(impressions_count), SUM(clicks_count), SUM(spent_impressions), SUM(spent_clicks)
+    FROM (
+        SELECT campaign_id, day, COUNT(*) AS impressions_count, 0 AS clicks_count, SUM(price) AS spent_impressions, 0 AS spent_clicks
+        FROM impressions
+        GROUP BY campaign_id, day
+        UNION ALL
+        SELECT campaign_id, day, 0, COUNT(*), 0, SUM(price)
+        FROM clicks
+        GROUP BY campaign_id, day
+    ) AS stats
+    GROUP BY campaign_id, day;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rebuild_counters();
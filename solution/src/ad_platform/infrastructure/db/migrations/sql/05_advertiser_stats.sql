@@ -0,0 +1,112 @@
+CREATE TABLE advertiser_stats (
+    advertiser_id UUID NOT NULL PRIMARY KEY,
+    impressions_count INTEGER NOT NULL DEFAULT 0,
+    clicks_count INTEGER NOT NULL DEFAULT 0,
+    spent_impressions FLOAT NOT NULL DEFAULT 0,
+    spent_clicks FLOAT NOT NULL DEFAULT 0,
+    CONSTRAINT fk_advertiser_stats_advertiser FOREIGN KEY (advertiser_id) REFERENCES advertisers (advertiser_id) ON DELETE CASCADE
+);
+
+CREATE FUNCTION advertiser_stats_impressions() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO advertiser_stats (advertiser_id, impressions_count, spent_impressions)
+    SELECT c.advertiser_id, COUNT(*), SUM(i.price)
+    FROM new_impressions i
+    JOIN campaigns c ON c.campaign_id = i.campaign_id
+    GROUP BY c.advertiser_id
+    ORDER BY c.advertiser_id
+    ON CONFLICT (advertiser_id)
+    DO UPDATE SET
+        impressions_count = advertiser_stats.impressions_count + EXCLUDED.impressions_count,
+        spent_impressions = advertiser_stats.spent_impressions + EXCLUDED.spent_impressions;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION advertiser_stats_clicks() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO advertiser_stats (advertiser_id, clicks_count, spent_clicks)
+    SELECT c.advertiser_id, COUNT(*), SUM(cl.price)
+    FROM new_clicks cl
+    JOIN campaigns c ON c.campaign_id = cl.campaign_id
+    GROUP BY c.advertiser_id
+    ORDER BY c.advertiser_id
+    ON CONFLICT (advertiser_id)
+    DO UPDATE SET
+        clicks_count = advertiser_stats.clicks_count + EXCLUDED.clicks_count,
+        spent_clicks = advertiser_stats.spent_clicks + EXCLUDED.spent_clicks;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER impressions_advertiser_stats
+AFTER INSERT ON impressions
+REFERENCING NEW TABLE AS new_impressions
+FOR EACH STATEMENT EXECUTE FUNCTION advertiser_stats_impressions();
+
+CREATE TRIGGER clicks_advertiser_stats
+AFTER INSERT ON clicks
+REFERENCING NEW TABLE AS new_clicks
+FOR EACH STATEMENT EXECUTE FUNCTION advertiser_stats_clicks();
+
+-- Итоги рекламодателей пересчитываются из дневной статистики кампаний.
+CREATE OR REPLACE FUNCTION rebuild_counters() RETURNS VOID AS $$
+BEGIN
+    LOCK TABLE impressions, clicks IN SHARE MODE;
+
+    DELETE FROM campaign_counters;
+
+    INSERT INTO campaign_counters (campaign_id, impressions_count, clicks_count)
+    SELECT campaign_id, SUM(impressions_count), SUM(clicks_count)
+    FROM (
+        SELECT campaign_id, COUNT(*) AS impressions_count, 0 AS clicks_count
+        FROM impressions
+        GROUP BY campaign_id
+        UNION ALL
+        SELECT campaign_id, 0, COUNT(*)
+        FROM clicks
+        GROUP BY campaign_id
+    ) AS counts
+    GROUP BY campaign_id;
+
+    DELETE FROM campaign_daily_stats;
+
+    INSERT INTO campaign_daily_stats (
+        campaign_id,
+        day,
+        impressions_count,
+        clicks_count,
+        spent_impressions,
+        spent_clicks
+    )
+    SELECT campaign_id, day, SUM(impressions_count), SUM(clicks_count), SUM(spent_impressions), SUM(spent_clicks)
+    FROM (
+        SELECT campaign_id, day, COUNT(*) AS impressions_count, 0 AS clicks_count, SUM(price) AS spent_impressions, 0 AS spent_clicks
+        FROM impressions
+        GROUP BY campaign_id, day
+        UNION ALL
+        SELECT campaign_id, day, 0, COUNT(*), 0, SUM(price)
+        FROM clicks
+        GROUP BY campaign_id, day
+    ) AS stats
+    GROUP BY campaign_id, day;
+
+    DELETE FROM advertiser_stats;
+
+    INSERT INTO advertiser_stats (
+        advertiser_id,
+        impressions_count,
+        clicks_count,
+        spent_impressions,
+        spent_clicks
+    )
+    SELECT c.advertiser_id, SUM(s.impressions_count), SUM(s.clicks_count), SUM(s.spent_impressions), SUM(s.spent_clicks)
+    FROM campaign_daily_stats s
+    JOIN campaigns c ON c.campaign_id = s.campaign_id
+    GROUP BY c.advertiser_id;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rebuild_counters();
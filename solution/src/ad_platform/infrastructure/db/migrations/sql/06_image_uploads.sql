@@ -0,0 +1,10 @@
+-- Изображения, загруженные в хранилище, но ещё не привязанные к кампании.
+-- Запись удаляется в той же транзакции, что выставляет image_url; оставшиеся
+-- записи старше IMAGE_UPLOAD_TTL удаляет команда очистки вместе с объектами.
+CREATE TABLE image_uploads (
+    image_id VARCHAR(255) NOT NULL PRIMARY KEY,
+    campaign_id UUID NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX image_uploads_created_at_idx ON image_uploads (created_at);
@@ -0,0 +1,13 @@
+-- Пачки массовой загрузки скоров до слияния в scores. Каждая пачка пишется
+-- отдельным коротким COPY, поэтому соединение не держится, пока читается тело
+-- запроса. Таблица не пишется в WAL: после сбоя бд её содержимое не нужно.
+CREATE UNLOGGED TABLE scores_uploads (
+    load_id UUID NOT NULL,
+    seq BIGINT GENERATED ALWAYS AS IDENTITY,
+    client_id UUID NOT NULL,
+    advertiser_id UUID NOT NULL,
+    score INTEGER NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX scores_uploads_load_id_idx ON scores_uploads (load_id);
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+
+import asyncpg
+
+from ad_platform.infrastructure.db.config import get_db_config
+
+logger = logging.getLogger("reconcile")
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    config = get_db_config()
+    conn = await asyncpg.connect(
+        host=config.host,
+        port=config.port,
+        user=config.user,
+        password=config.password,
+    )
+
+    logger.info("Rebuilding counters from impressions and clicks")
+
+    async with conn.transaction():
+        await conn.execute("SELECT rebuild_counters()")
+
+    await conn.close()
+
+    logger.info("Counters rebuilt")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
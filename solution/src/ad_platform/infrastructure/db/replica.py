@@ -0,0 +1,22 @@
+from ad_platform.infrastructure.cache.common import CacheGateway
+from ad_platform.infrastructure.db.config import DBConfig
+
+
+# Выбор между репликой и основной БД для чтений. После записи рекламодателя
+# чтения этого рекламодателя некоторое время идут в основную БД, чтобы он видел
+# свои изменения несмотря на отставание реплики. Отметка хранится в Redis и видна всем процессам.
+class ReplicaRouter:
+    def __init__(self, config: DBConfig, cache_gateway: CacheGateway) -> None:
+        self.enabled = config.replica_host is not None
+        self.lag = config.replica_lag
+        self.cache_gateway = cache_gateway
+
+    async def mark_written(self, key: str) -> None:
+        if self.enabled:
+            await self.cache_gateway.set(f"primary:{key}", "1", ttl=self.lag)
+
+    async def use_primary(self, key: str) -> bool:
+        if not self.enabled:
+            return True
+
+        return await self.cache_gateway.get(f"primary:{key}") is not None
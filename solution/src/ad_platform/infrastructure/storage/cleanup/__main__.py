@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+import asyncpg
+from miniopy_async import Minio
+
+from ad_platform.infrastructure.db.config import get_db_config
+from ad_platform.infrastructure.storage.config import get_storage_config
+from ad_platform.infrastructure.storage.impl import ImageGatewayImpl
+
+logger = logging.getLogger("cleanup")
+
+BATCH_SIZE = 1000
+
+# Изображения, уже выставленные кампании, не трогаем: удалённые из кампании
+# картинки хранятся для разбирательств.
+STALE_UPLOADS_QUERY = """
+SELECT u.image_id
+FROM image_uploads u
+WHERE u.created_at < now() - make_interval(secs => $1)
+  AND NOT EXISTS (SELECT 1 FROM campaigns c WHERE c.image_url = u.image_id)
+ORDER BY u.created_at
+LIMIT $2
+"""
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    db_config = get_db_config()
+    storage_config = get_storage_config()
+
+    conn = await asyncpg.connect(
+        host=db_config.host,
+        port=db_config.port,
+        user=db_config.user,
+        password=db_config.password,
+    )
+    images = ImageGatewayImpl(
+        Minio(
+            storage_config.url,
+            access_key=storage_config.access_key,
+            secret_key=storage_config.secret_key,
+            secure=False,
+        ),
+    )
+
+    logger.info(
+        "Removing image uploads older than %s seconds",
+        storage_config.upload_ttl,
+    )
+
+    removed = 0
+    while True:
+        rows = await conn.fetch(
+            STALE_UPLOADS_QUERY,
+            storage_config.upload_ttl,
+            BATCH_SIZE,
+        )
+        if not rows:
+            break
+
+        image_ids = [row["image_id"] for row in rows]
+
+        for image_id in image_ids:
+            await images.delete(image_id)
+
+        await conn.execute(
+            "DELETE FROM image_uploads WHERE image_id = ANY($1::varchar[])",
+            image_ids,
+        )
+        removed += len(image_ids)
+
+    await conn.close()
+
+    logger.info("Removed %s abandoned images", removed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
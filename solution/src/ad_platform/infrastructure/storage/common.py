@@ -6,3 +6,5 @@ from typing import Protocol
 class ImageGateway(Protocol):
     @abstractmethod
     async def put(self, image: BytesIO, name: str) -> None: ...
+    @abstractmethod
+    async def delete(self, name: str) -> None: ...
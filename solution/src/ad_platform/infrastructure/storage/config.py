@@ -8,6 +8,7 @@ class StorageConfig:
     access_key: str
     secret_key: str
     cdn: str
+    upload_ttl: int
 
 
 def get_storage_config() -> StorageConfig:
@@ -16,4 +17,5 @@ def get_storage_config() -> StorageConfig:
         access_key=os.getenv("MINIO_ACCESS_KEY"),
         secret_key=os.getenv("MINIO_SECRET_KEY"),
         cdn=os.getenv("CDN_URL"),
+        upload_ttl=int(os.getenv("IMAGE_UPLOAD_TTL", "3600")),
     )
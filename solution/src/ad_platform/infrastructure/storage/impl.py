@@ -18,3 +18,6 @@ class ImageGatewayImpl(ImageGateway):
             length=-1,
             part_size=1024 * 1024 * 5,
         )
+
+    async def delete(self, name: str) -> None:
+        await self.client.remove_object(self.bucket_name, name)
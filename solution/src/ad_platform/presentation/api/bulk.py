@@ -0,0 +1,141 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, Generic, TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ItemT = TypeVar("ItemT")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Размер пачки, которая уходит в БД одним запросом
+BULK_BATCH_SIZE = 10_000
+
+# Сколько ошибок разбора попадает в ответ потоковой загрузки
+MAX_REPORTED_ERRORS = 100
+
+
+def bulk_request_body(model: type[BaseModel]) -> dict[str, Any]:
+    schema = {"$ref": f"#/components/schemas/{model.__name__}"}
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": {"type": "array", "items": schema}},
+                NDJSON_MEDIA_TYPE: {"schema": schema},
+            },
+        },
+    }
+
+
+def format_errors(exc: ValidationError) -> str:
+    return "; ".join(
+        ": ".join(filter(None, (".".join(map(str, e["loc"])), e["msg"])))
+        for e in exc.errors()
+    )
+
+
+async def iter_lines(request: Request) -> AsyncIterator[tuple[int, bytes]]:
+    line_no = 0
+    tail = b""
+
+    async for chunk in request.stream():
+        *lines, tail = (tail + chunk).split(b"\n")
+
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+
+    if tail.strip():
+        yield line_no + 1, tail
+
+
+def parse_item(model: type[ModelT], data: bytes) -> ModelT:
+    try:
+        return model.model_validate_json(data)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+
+
+# Тело массовой загрузки: JSON-массив целиком или NDJSON, который разбирается
+# построчно по мере чтения запроса.
+async def iter_bulk_items(
+    request: Request,
+    model: type[ModelT],
+) -> AsyncIterator[ModelT]:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if content_type != NDJSON_MEDIA_TYPE:
+        try:
+            items = TypeAdapter(list[model]).validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError(exc.errors()) from exc
+
+        for item in items:
+            yield item
+
+        return
+
+    async for _, line in iter_lines(request):
+        yield parse_item(model, line)
+
+
+# Потоковая загрузка NDJSON: невалидные строки не прерывают загрузку;
+# они считаются и попадают в ответ, где указан номер строки.
+class NdjsonReader(Generic[ModelT]):
+    def __init__(self, request: Request, model: type[ModelT]) -> None:
+        self.request = request
+        self.model = model
+        self.received = 0
+        self.failed = 0
+        self.errors: list[tuple[int, str]] = []
+
+    async def items(self) -> AsyncIterator[ModelT]:
+        async for line_no, line in iter_lines(self.request):
+            self.received += 1
+
+            try:
+                item = self.model.model_validate_json(line)
+            except ValidationError as exc:
+                self.failed += 1
+
+                if len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors.append((line_no, format_errors(exc)))
+
+                continue
+
+            yield item
+
+
+async def batched(
+    items: AsyncIterable[ItemT],
+    size: int = BULK_BATCH_SIZE,
+) -> AsyncIterator[list[ItemT]]:
+    batch = []
+
+    async for item in items:
+        batch.append(item)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def ndjson_request_body(model: type[BaseModel]) -> dict[str, Any]:
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {"$ref": f"#/components/schemas/{model.__name__}"},
+                },
+            },
+        },
+    }
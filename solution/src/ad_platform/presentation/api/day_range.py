@@ -0,0 +1,33 @@
+from dataclasses import replace
+from typing import Annotated, Optional
+
+from fastapi import Depends, Query
+
+from ad_platform.domain.entities import DayRange
+
+
+def day_period(
+    from_day: Annotated[
+        int,
+        Query(description="Первый день периода включительно.", ge=0),
+    ] = 0,
+    to_day: Annotated[
+        Optional[int],
+        Query(description="Последний день периода включительно.", ge=0),
+    ] = None,
+) -> DayRange:
+    return DayRange(from_day=from_day, to_day=to_day)
+
+
+def day_page(
+    period: Annotated[DayRange, Depends(day_period)],
+    after: Annotated[
+        Optional[int],
+        Query(description="Курсор: вернуть дни строго после указанного.", ge=0),
+    ] = None,
+    limit: Annotated[
+        Optional[int],
+        Query(description="Максимальное количество дней в ответе.", ge=1),
+    ] = None,
+) -> DayRange:
+    return replace(period, after=after, limit=limit)
@@ -1,18 +1,34 @@
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Request
 from pydantic import UUID4
 
-from ad_platform.application.interactors.create_score import CreateScoreInteractor
+from ad_platform.application.interactors.create_score import (
+    CreateScoreInteractor,
+    CreateScoresInteractor,
+)
 from ad_platform.application.services.advertiser import AdvertiserService
-from ad_platform.domain.entities import Score
+from ad_platform.domain.entities import Advertiser, Score
+from ad_platform.presentation.api.bulk import (
+    NdjsonReader,
+    batched,
+    bulk_request_body,
+    iter_bulk_items,
+    ndjson_request_body,
+)
 from ad_platform.presentation.api.schemas.adveriser import (
     AdvertiserResponse,
     AdvertiserUpsertRequest,
     MLScoreRequest,
 )
+from ad_platform.presentation.api.schemas.bulk import (
+    BulkItemError,
+    BulkStreamSummaryResponse,
+    BulkSummaryResponse,
+)
 from ad_platform.presentation.api.schemas.errors import (
     InvalidRequestResponse,
     NotFoundResponse,
@@ -83,6 +99,45 @@ async def create_or_update_advertisers(
     ]
 
 
+async def iter_advertisers(
+    reader: NdjsonReader[AdvertiserUpsertRequest],
+) -> AsyncIterator[Advertiser]:
+    async for body in reader.items():
+        yield Advertiser(advertiser_id=body.advertiser_id, name=body.name)
+
+
+@router.post(
+    "/advertisers/bulk/stream",
+    summary="Потоковое создание/обновление рекламодателей",
+    description="Принимает рекламодателей в формате NDJSON (по одному в строке), "
+    "записывает их пачками по мере чтения запроса и возвращает сводку.",
+    status_code=201,
+    openapi_extra=ndjson_request_body(AdvertiserUpsertRequest),
+    responses={
+        201: {
+            "description": "Сводка загрузки рекламодателей",
+            "model": BulkStreamSummaryResponse,
+        },
+    },
+)
+async def create_or_update_advertisers_stream(
+    request: Request,
+    advertiser_service: FromDishka[AdvertiserService],
+) -> BulkStreamSummaryResponse:
+    reader = NdjsonReader(request, AdvertiserUpsertRequest)
+
+    upserted = await advertiser_service.upsert_advertisers_batches(
+        batched(iter_advertisers(reader)),
+    )
+
+    return BulkStreamSummaryResponse(
+        received=reader.received,
+        upserted=upserted,
+        failed=reader.failed,
+        errors=[BulkItemError(line=line, detail=detail) for line, detail in reader.errors],
+    )
+
+
 @router.post(
     "/ml-scores",
     summary="Добавление или обновление ML скора",
@@ -112,3 +167,45 @@ async def create_or_update_ml_scores(
             score=body.score,
         ),
     )
+
+
+async def iter_scores(request: Request) -> AsyncIterator[Score]:
+    async for body in iter_bulk_items(request, MLScoreRequest):
+        yield Score(
+            client_id=body.client_id,
+            advertiser_id=body.advertiser_id,
+            score=body.score,
+        )
+
+
+@router.post(
+    "/ml-scores/bulk",
+    summary="Массовое добавление или обновление ML скоров",
+    description="Принимает JSON-массив ML скоров или NDJSON (application/x-ndjson) "
+    "по одному скору в строке и применяет их одной транзакцией.",
+    openapi_extra=bulk_request_body(MLScoreRequest),
+    responses={
+        200: {
+            "description": "ML скоры успешно добавлены или обновлены.",
+            "model": BulkSummaryResponse,
+        },
+        400: {
+            "description": "Некорректные данные запроса.",
+            "model": InvalidRequestResponse,
+        },
+        404: {
+            "description": "Клиенты или рекламодатели не найдены.",
+            "model": NotFoundResponse,
+        },
+    },
+)
+async def create_or_update_ml_scores_bulk(
+    request: Request,
+    action: FromDishka[CreateScoresInteractor],
+) -> BulkSummaryResponse:
+    summary = await action(batched(iter_scores(request)))
+
+    return BulkSummaryResponse(
+        received=summary.received,
+        upserted=summary.upserted,
+    )
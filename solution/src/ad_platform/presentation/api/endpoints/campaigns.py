@@ -1,9 +1,12 @@
-from dataclasses import asdict
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import asdict, dataclass
 from typing import Annotated, Optional
+from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, File, Path, Query, UploadFile
+from fastapi import APIRouter, Depends, File, Path, Query, Response, UploadFile
 from pydantic import UUID4
 
 from ad_platform.application.interactors.create_campaign import CreateCampaignInteractor
@@ -14,7 +17,14 @@ from ad_platform.application.interactors.update_campaign import (
     UpdateCampaignInteractor,
 )
 from ad_platform.application.services.campaigns import CampaignService
-from ad_platform.domain.entities import Campaign, CampaignTarget, Gender
+from ad_platform.domain.entities import (
+    AdvertiserId,
+    Campaign,
+    CampaignId,
+    CampaignTarget,
+    Gender,
+)
+from ad_platform.domain.exceptions import BusinessValidationError
 from ad_platform.presentation.api.schemas.campaign import (
     CampaignCreateRequest,
     CampaignResponse,
@@ -33,6 +43,51 @@ router = APIRouter(
 )
 
 
+# Токен для следующей страницы списка кампаний - непрозрачная строка
+# из (advertiser_id, campaign_id) последней кампании страницы.
+def encode_cursor(advertiser_id: AdvertiserId, campaign_id: CampaignId) -> str:
+    raw = advertiser_id.bytes + campaign_id.bytes
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(advertiser_id: AdvertiserId, cursor: str) -> CampaignId:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError):
+        raw = b""
+
+    if len(raw) != 32 or UUID(bytes=raw[:16]) != advertiser_id:
+        raise BusinessValidationError(detail="Некорректный курсор.")
+
+    return CampaignId(UUID(bytes=raw[16:]))
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignPage:
+    page: int
+    size: int
+    after: CampaignId | None
+
+
+def campaign_page(
+    advertiser_id: Annotated[UUID4, Path(description="UUID рекламодателя.")],
+    page: Annotated[Optional[int], Query(description="Номер страницы.", ge=0)] = 0,
+    size: Annotated[
+        Optional[int],
+        Query(description="Количество элементов на странице.", ge=1),
+    ] = 10,
+    after: Annotated[
+        Optional[str],
+        Query(description="Курсор из X-Next-Cursor, при нём page не учитывается."),
+    ] = None,
+) -> CampaignPage:
+    return CampaignPage(
+        page=page,
+        size=size,
+        after=decode_cursor(advertiser_id, after) if after is not None else None,
+    )
+
+
 @router.post(
     "",
     summary="Создание рекламной кампании",
@@ -90,11 +145,18 @@ async def create_campaign(
 @router.get(
     "",
     summary="Получение рекламных кампаний рекламодателя с пагинацией",
-    description="Возвращает список рекламных кампаний для указанного рекламодателя с пагинацией.",
+    description="Возвращает список рекламных кампаний для указанного рекламодателя с пагинацией. "
+    "Если страница заполнена, заголовок X-Next-Cursor содержит курсор следующей страницы.",
     responses={
         200: {
             "description": "Список рекламных кампаний рекламодателя.",
             "model": list[CampaignResponse],
+            "headers": {
+                "X-Next-Cursor": {
+                    "description": "Курсор для параметра after.",
+                    "schema": {"type": "string"},
+                },
+            },
         },
         400: {
             "description": "Некорректные данные запроса.",
@@ -109,13 +171,21 @@ async def create_campaign(
 async def get_campaigns(
     advertiser_id: Annotated[UUID4, Path(description="UUID рекламодателя.")],
     action: FromDishka[GetCampaignsInteractor],
-    page: Annotated[Optional[int], Query(description="Номер страницы.", ge=0)] = 0,
-    size: Annotated[
-        Optional[int],
-        Query(description="Количество элементов на странице.", ge=1),
-    ] = 10,
+    response: Response,
+    pagination: Annotated[CampaignPage, Depends(campaign_page)],
 ) -> list[CampaignResponse]:
-    compaigns = await action(advertiser_id, page, size)
+    compaigns = await action(
+        advertiser_id,
+        pagination.page,
+        pagination.size,
+        pagination.after,
+    )
+
+    if compaigns and len(compaigns) == pagination.size:
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            advertiser_id,
+            compaigns[-1].campaign_id,
+        )
 
     return [CampaignResponse(**asdict(c)) for c in compaigns]
 
@@ -1,11 +1,18 @@
+from collections.abc import AsyncIterator
 from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Request
 from pydantic import UUID4
 
 from ad_platform.application.services.client import ClientService
+from ad_platform.domain.entities import Client
+from ad_platform.presentation.api.bulk import NdjsonReader, batched, ndjson_request_body
+from ad_platform.presentation.api.schemas.bulk import (
+    BulkItemError,
+    BulkStreamSummaryResponse,
+)
 from ad_platform.presentation.api.schemas.client import (
     ClientResponse,
     ClientUpsertRequest,
@@ -85,3 +92,48 @@ async def create_or_update_clients(
         )
         for client in response
     ]
+
+
+async def iter_clients(
+    reader: NdjsonReader[ClientUpsertRequest],
+) -> AsyncIterator[Client]:
+    async for body in reader.items():
+        yield Client(
+            client_id=body.client_id,
+            login=body.login,
+            age=body.age,
+            location=body.location,
+            gender=body.gender,
+        )
+
+
+@router.post(
+    "/bulk/stream",
+    summary="Потоковое создание/обновление клиентов",
+    description="Принимает клиентов в формате NDJSON (по одному в строке), записывает их "
+    "пачками по мере чтения запроса и возвращает сводку вместо списка клиентов.",
+    status_code=201,
+    openapi_extra=ndjson_request_body(ClientUpsertRequest),
+    responses={
+        201: {
+            "description": "Сводка загрузки клиентов",
+            "model": BulkStreamSummaryResponse,
+        },
+    },
+)
+async def create_or_update_clients_stream(
+    request: Request,
+    client_service: FromDishka[ClientService],
+) -> BulkStreamSummaryResponse:
+    reader = NdjsonReader(request, ClientUpsertRequest)
+
+    upserted = await client_service.upsert_clients_batches(
+        batched(iter_clients(reader)),
+    )
+
+    return BulkStreamSummaryResponse(
+        received=reader.received,
+        upserted=upserted,
+        failed=reader.failed,
+        errors=[BulkItemError(line=line, detail=detail) for line, detail in reader.errors],
+    )
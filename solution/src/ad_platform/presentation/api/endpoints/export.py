@@ -0,0 +1,115 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from typing import Annotated, Optional
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
+from pydantic import UUID4
+
+from ad_platform.application.interactors.export_events import ExportEventsInteractor
+from ad_platform.domain.entities import DayRange, Event
+from ad_platform.presentation.api.day_range import day_period
+from ad_platform.presentation.api.schemas.errors import (
+    InvalidRequestResponse,
+    NotFoundResponse,
+)
+from ad_platform.presentation.api.schemas.export import ExportFormat
+
+# Сколько строк склеивается в один чанк ответа
+CHUNK_SIZE = 1000
+
+CSV_COLUMNS = ("event", "campaign_id", "client_id", "day", "price")
+
+router = APIRouter(
+    prefix="/export",
+    tags=["Export"],
+    route_class=DishkaRoute,
+)
+
+
+def event_to_row(event: Event) -> tuple:
+    return (
+        event.event.value,
+        str(event.campaign_id),
+        str(event.client_id),
+        event.day,
+        event.price,
+    )
+
+
+async def stream_ndjson(events: AsyncIterator[Event]) -> AsyncIterator[str]:
+    chunk = []
+
+    async for event in events:
+        chunk.append(json.dumps(dict(zip(CSV_COLUMNS, event_to_row(event)))))
+
+        if len(chunk) >= CHUNK_SIZE:
+            yield "\n".join(chunk) + "\n"
+            chunk.clear()
+
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+async def stream_csv(events: AsyncIterator[Event]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    rows = 0
+
+    async for event in events:
+        writer.writerow(event_to_row(event))
+        rows += 1
+
+        if rows >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+
+    yield buffer.getvalue()
+
+
+@router.get(
+    "/advertisers/{advertiser_id}/events",
+    summary="Выгрузка событий показов и переходов",
+    description="Потоково отдаёт сырые показы и переходы по кампаниям рекламодателя "
+    "в формате NDJSON или CSV.",
+    responses={
+        200: {
+            "description": "События успешно выгружены.",
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        400: {
+            "description": "Некорректные данные запроса.",
+            "model": InvalidRequestResponse,
+        },
+        404: {
+            "description": "Рекламодатель или кампания не найдены.",
+            "model": NotFoundResponse,
+        },
+    },
+)
+async def export_events(
+    advertiser_id: Annotated[UUID4, Path(description="UUID рекламодателя.")],
+    action: FromDishka[ExportEventsInteractor],
+    period: Annotated[DayRange, Depends(day_period)],
+    campaign_id: Annotated[
+        Optional[UUID4],
+        Query(description="UUID рекламной кампании рекламодателя."),
+    ] = None,
+    export_format: Annotated[
+        ExportFormat,
+        Query(alias="format", description="Формат выгрузки (ndjson или csv)."),
+    ] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+    events = await action(advertiser_id, campaign_id, period)
+
+    if export_format == ExportFormat.CSV:
+        return StreamingResponse(stream_csv(events), media_type="text/csv")
+
+    return StreamingResponse(stream_ndjson(events), media_type="application/x-ndjson")
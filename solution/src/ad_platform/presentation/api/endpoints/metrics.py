@@ -0,0 +1,38 @@
+from typing import Any
+
+from asyncpg import Pool
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter
+
+from ad_platform.infrastructure.cache.lru import ClientCache
+from ad_platform.infrastructure.db.connection import ReplicaPool
+from ad_platform.infrastructure.db.metrics import PoolMetrics, ReplicaPoolMetrics
+
+router = APIRouter(
+    tags=["Service"],
+    route_class=DishkaRoute,
+)
+
+
+@router.get(
+    "/metrics",
+    summary="Внутренние метрики",
+    description="Возвращает счётчики внутренних кэшей и пула соединений процесса.",
+)
+async def get_metrics(
+    client_cache: FromDishka[ClientCache],
+    pool: FromDishka[Pool],
+    pool_metrics: FromDishka[PoolMetrics],
+    replica_pool: FromDishka[ReplicaPool],
+    replica_pool_metrics: FromDishka[ReplicaPoolMetrics],
+) -> dict[str, Any]:
+    metrics = {
+        "client_cache": client_cache.stats(),
+        "db_pool": pool_metrics.stats(pool),
+    }
+
+    if replica_pool is not pool:
+        metrics["db_replica_pool"] = replica_pool_metrics.stats(replica_pool)
+
+    return metrics
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Body, Depends, Path
 from pydantic import UUID4
 
 from ad_platform.application.interactors.get_advertiser_stats import (
@@ -11,13 +11,20 @@ from ad_platform.application.interactors.get_advertiser_stats import (
 )
 from ad_platform.application.interactors.get_campaign_stats import (
     GetCampaignDailyStatsInteractor,
+    GetCampaignsStatsInteractor,
     GetCampaignStatsInteractor,
 )
+from ad_platform.domain.entities import DayRange
+from ad_platform.presentation.api.day_range import day_page
 from ad_platform.presentation.api.schemas.errors import (
     InvalidRequestResponse,
     NotFoundResponse,
 )
-from ad_platform.presentation.api.schemas.stats import DailyStats, Stats
+from ad_platform.presentation.api.schemas.stats import (
+    CampaignStats,
+    DailyStats,
+    Stats,
+)
 
 router = APIRouter(
     prefix="/stats",
@@ -62,6 +69,48 @@ async def get_campaign_stats(
     )
 
 
+@router.post(
+    "/campaigns/bulk",
+    summary="Получение статистики по нескольким рекламным кампаниям",
+    description="Возвращает агрегированную статистику для каждой из заданных "
+    "рекламных кампаний в порядке запроса.",
+    responses={
+        200: {
+            "description": "Статистика по кампаниям успешно получена.",
+            "model": list[CampaignStats],
+        },
+        400: {
+            "description": "Некорректные данные запроса.",
+            "model": InvalidRequestResponse,
+        },
+        404: {
+            "description": "Одна или несколько кампаний не найдены.",
+            "model": NotFoundResponse,
+        },
+    },
+)
+async def get_campaigns_stats(
+    body: Annotated[
+        list[UUID4],
+        Body(description="Список UUID рекламных кампаний.", min_length=1, max_length=1000),
+    ],
+    action: FromDishka[GetCampaignsStatsInteractor],
+) -> list[CampaignStats]:
+    data = await action(body)
+    return [
+        CampaignStats(
+            campaign_id=stats.campaign_id,
+            clicks_count=stats.clicks_count,
+            impressions_count=stats.impressions_count,
+            conversion=stats.conversion,
+            spent_impressions=stats.spent_impressions,
+            spent_clicks=stats.spent_clicks,
+            spent_total=stats.spent_total,
+        )
+        for stats in data
+    ]
+
+
 @router.get(
     "/advertisers/{advertiser_id}/campaigns",
     summary="Получение статистики по рекламодателю",
@@ -121,8 +170,9 @@ async def get_advertiser_stats(
 async def get_daily_stats(
     campaign_id: Annotated[UUID4, Path(description="UUID рекламной кампании.")],
     action: FromDishka[GetCampaignDailyStatsInteractor],
+    day_range: Annotated[DayRange, Depends(day_page)],
 ) -> list[DailyStats]:
-    resp = await action(campaign_id)
+    resp = await action(campaign_id, day_range)
 
     return [
         DailyStats(
@@ -162,8 +212,9 @@ async def get_daily_stats(
 async def get_advertiser_daily_stats(
     advertiser_id: Annotated[UUID4, Path(description="UUID рекламодателя.")],
     action: FromDishka[GetAdvertiserDailyStatsInteractor],
+    day_range: Annotated[DayRange, Depends(day_page)],
 ) -> list[DailyStats]:
-    resp = await action(advertiser_id)
+    resp = await action(advertiser_id, day_range)
 
     return [
         DailyStats(
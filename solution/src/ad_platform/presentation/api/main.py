@@ -1,4 +1,6 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from functools import partial
 from typing import Any
 
@@ -17,6 +19,8 @@ from ad_platform.presentation.api.endpoints import (
     advertisers,
     campaigns,
     clients,
+    export,
+    metrics,
     ping,
     stats,
     time_testing,
@@ -30,8 +34,16 @@ from ad_platform.presentation.api.endpoints.error_handlers import (
 from ad_platform.presentation.di import create_container
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+    # При закрытии контейнера дописываются показы из буфера
+    await app.state.dishka_container.close()
+
+
 def create_fastapi_app() -> FastAPI:
-    app = FastAPI(docs_url="/docs/")
+    app = FastAPI(docs_url="/docs/", lifespan=lifespan)
 
     # Костыль для удаления ошибки 422 в документации
     _openapi = app.openapi
@@ -65,8 +77,10 @@ def create_fastapi_app() -> FastAPI:
     app.include_router(router=campaigns.router)
     app.include_router(router=ads.router)
     app.include_router(router=stats.router)
+    app.include_router(router=export.router)
     app.include_router(router=time_testing.router)
     app.include_router(router=ping.router)
+    app.include_router(router=metrics.router)
 
     return app
 
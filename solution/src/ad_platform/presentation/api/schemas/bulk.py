@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class BulkSummaryResponse(BaseModel):
+    received: Annotated[
+        int,
+        Field(..., description="Сколько записей получено в запросе."),
+    ]
+    upserted: Annotated[
+        int,
+        Field(..., description="Сколько записей создано или изменено."),
+    ]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "received": 0,
+                "upserted": 0,
+            },
+        },
+    }
+
+
+class BulkItemError(BaseModel):
+    line: Annotated[int, Field(..., description="Номер строки NDJSON.")]
+    detail: Annotated[str, Field(..., description="Описание ошибки.")]
+
+
+class BulkStreamSummaryResponse(BulkSummaryResponse):
+    failed: Annotated[
+        int,
+        Field(..., description="Сколько строк не прошло проверку."),
+    ]
+    errors: Annotated[
+        list[BulkItemError],
+        Field(..., description="Ошибки по строкам (не более 100)."),
+    ]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "received": 3,
+                "upserted": 2,
+                "failed": 1,
+                "errors": [{"line": 2, "detail": "age: Input should be a valid integer"}],
+            },
+        },
+    }
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import UUID4, BaseModel, Field
 
 
 class Stats(BaseModel):
@@ -77,3 +77,24 @@ class DailyStats(Stats):
             },
         },
     }
+
+
+class CampaignStats(Stats):
+    campaign_id: Annotated[
+        UUID4,
+        Field(..., description="UUID рекламной кампании."),
+    ]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "campaign_id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+                "impressions_count": 0,
+                "clicks_count": 0,
+                "conversion": 0,
+                "spent_impressions": 0,
+                "spent_clicks": 0,
+                "spent_total": 0,
+            },
+        },
+    }
@@ -8,6 +8,7 @@ import asyncpg
 import httpx
 import pytest
 import pytest_asyncio
+from redis.asyncio import Redis
 
 
 @pytest_asyncio.fixture
@@ -39,6 +40,24 @@ async def db_connection():
     await conn.close()
 
 
+@pytest_asyncio.fixture()
+async def db_pool(db_connection: asyncpg.Connection):
+    pool = await asyncpg.create_pool(dsn=os.environ["DATABASE_DSN"], min_size=1, max_size=2)
+
+    yield pool
+
+    await pool.close()
+
+
+@pytest_asyncio.fixture()
+async def redis():
+    redis = Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+
+    yield redis
+
+    await redis.aclose()
+
+
 @pytest.fixture
 def client_data() -> dict[str, Any]:
     return {
@@ -0,0 +1,54 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from ad_platform.infrastructure.cache.clock import Clock
+
+
+async def wait_until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+    pytest.fail("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_clock_propagates_day(redis: Redis):
+    # отдельный канал, чтобы не сдвинуть день запущенному приложению
+    channel = f"time-test-{uuid4()}"
+    writer = Clock(redis, channel)
+    reader = Clock(redis, channel)
+    reader.start()
+
+    await asyncio.wait_for(reader.subscribed.wait(), timeout=1)
+    version = reader.version
+
+    writer.set(5)
+    await writer.publish(5)
+    await wait_until(lambda: reader.day == 5)
+
+    assert writer.day == 5
+    assert reader.version == version + 1
+
+    # значение, прочитанное до уведомления, не перезаписывает новое
+    reader.load(4, version)
+    assert reader.day == 5
+
+    reader.load(6, reader.version)
+    assert reader.day == 6
+
+    await reader.close()
+
+
+@pytest.mark.asyncio
+async def test_clock_without_subscription_is_not_cached(redis: Redis):
+    clock = Clock(redis, f"time-test-{uuid4()}")
+
+    clock.load(3, clock.version)
+
+    # без подписки TimeService читает день из Redis на каждом запросе
+    assert clock.day is None
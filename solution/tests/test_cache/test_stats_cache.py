@@ -0,0 +1,110 @@
+from dataclasses import asdict
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from ad_platform.application.services.stats_service import StatsService
+from ad_platform.domain.entities import DailyStats, DayRange, Stats
+from ad_platform.infrastructure.cache.config import CacheConfig
+from ad_platform.infrastructure.cache.impl import CacheGatewayImpl
+
+TTL = 30
+
+
+class CountingStatsGateway:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def stats(self) -> Stats:
+        self.calls += 1
+        return Stats(
+            impressions_count=self.calls,
+            clicks_count=0,
+            conversion=0,
+            spent_impressions=0,
+            spent_clicks=0,
+            spent_total=0,
+        )
+
+    async def get_campaign_stats(self, campaign_id) -> Stats:
+        return self.stats()
+
+    async def get_advertiser_stats(self, advertiser_id) -> Stats:
+        return self.stats()
+
+    async def get_campaign_daily_stats(self, campaign_id, day_range) -> list[DailyStats]:
+        return [DailyStats(**asdict(self.stats()), date=0)]
+
+
+def make_service(redis: Redis, ttl: int) -> tuple[StatsService, CountingStatsGateway]:
+    gateway = CountingStatsGateway()
+    config = CacheConfig(
+        host="",
+        port=0,
+        client_cache_size=0,
+        client_cache_ttl=0,
+        stats_cache_ttl=ttl,
+    )
+
+    return StatsService(gateway, CacheGatewayImpl(redis), config), gateway
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_hit(redis: Redis):
+    service, gateway = make_service(redis, TTL)
+    campaign_id = uuid4()
+
+    first = await service.get_campaign_stats(campaign_id)
+    second = await service.get_campaign_stats(campaign_id)
+
+    assert first == second
+    assert gateway.calls == 1
+    assert 0 < await redis.ttl(f"stats:campaign:{campaign_id}") <= TTL
+
+    await service.invalidate(campaign_id, uuid4())
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_invalidate(redis: Redis):
+    service, gateway = make_service(redis, TTL)
+    campaign_id = uuid4()
+    advertiser_id = uuid4()
+
+    await service.get_campaign_stats(campaign_id)
+    await service.get_advertiser_stats(advertiser_id)
+    await service.get_campaign_daily_stats(campaign_id, DayRange())
+    assert gateway.calls == 3
+
+    # так делает клик
+    await service.invalidate(campaign_id, advertiser_id)
+
+    assert (await service.get_campaign_stats(campaign_id)).impressions_count == 4
+    assert (await service.get_advertiser_stats(advertiser_id)).impressions_count == 5
+    assert (await service.get_campaign_daily_stats(campaign_id, DayRange()))[0].impressions_count == 6
+
+    await service.invalidate(campaign_id, advertiser_id)
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_skips_day_ranges(redis: Redis):
+    service, gateway = make_service(redis, TTL)
+    campaign_id = uuid4()
+
+    await service.get_campaign_daily_stats(campaign_id, DayRange(from_day=1))
+    await service.get_campaign_daily_stats(campaign_id, DayRange(from_day=1))
+
+    assert gateway.calls == 2
+    assert await redis.get(f"stats:campaign_daily:{campaign_id}") is None
+
+
+@pytest.mark.asyncio
+async def test_stats_cache_disabled(redis: Redis):
+    service, gateway = make_service(redis, 0)
+    campaign_id = uuid4()
+
+    await service.get_campaign_stats(campaign_id)
+    await service.get_campaign_stats(campaign_id)
+
+    assert gateway.calls == 2
+    assert await redis.get(f"stats:campaign:{campaign_id}") is None
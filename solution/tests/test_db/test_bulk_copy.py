@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+import pytest
+from asyncpg import Connection, Pool
+
+from ad_platform.domain.entities import Advertiser, Client, ClientGender
+from ad_platform.infrastructure.db.commiter import CommiterError, CommiterImpl
+from ad_platform.infrastructure.db.connection import LazyConnection, ReplicaConnection
+from ad_platform.infrastructure.db.gateways.advertiser import AdvertiserGatewayImpl
+from ad_platform.infrastructure.db.gateways.client import ClientGatewayImpl
+from ad_platform.infrastructure.db.metrics import PoolMetrics
+
+
+def make_clients(count: int) -> list[Client]:
+    return [
+        Client(
+            client_id=uuid4(),
+            login="login",
+            age=20,
+            location="Moscow",
+            gender=ClientGender.MALE,
+        )
+        for _ in range(count)
+    ]
+
+
+async def count_clients(conn: Connection, clients: list[Client]) -> int:
+    return await conn.fetchval(
+        "SELECT count(*) FROM clients WHERE client_id = ANY($1::uuid[])",
+        [c.client_id for c in clients],
+    )
+
+
+@pytest.mark.asyncio
+async def test_copy_requires_transaction(db_connection: Connection, db_pool: Pool):
+    conn = LazyConnection(db_pool, PoolMetrics())
+    clients = make_clients(2)
+
+    # в autocommit строки временной таблицы пропали бы до слияния
+    with pytest.raises(CommiterError):
+        await ClientGatewayImpl(conn).copy_clients(clients)
+
+    with pytest.raises(CommiterError):
+        await AdvertiserGatewayImpl(conn).copy_advertisers(
+            [Advertiser(advertiser_id=uuid4(), name="name")],
+        )
+
+    assert conn.conn is None
+    assert not await count_clients(db_connection, clients)
+
+
+@pytest.mark.asyncio
+async def test_copy_in_transaction(db_connection: Connection, db_pool: Pool):
+    conn = LazyConnection(db_pool, PoolMetrics())
+    clients = make_clients(3)
+
+    async with CommiterImpl(conn, ReplicaConnection(db_pool, PoolMetrics())):
+        await ClientGatewayImpl(conn).copy_clients(clients)
+
+    assert await count_clients(db_connection, clients) == 3
@@ -0,0 +1,126 @@
+from uuid import uuid4
+
+import pytest
+from asyncpg import Connection, Pool, ReadOnlySQLTransactionError
+
+from ad_platform.infrastructure.db.commiter import CommiterImpl
+from ad_platform.infrastructure.db.connection import LazyConnection, ReplicaConnection
+from ad_platform.infrastructure.db.metrics import PoolMetrics
+
+
+@pytest.mark.asyncio
+async def test_nested_acquire_shares_connection(db_pool: Pool):
+    metrics = PoolMetrics()
+    conn = LazyConnection(db_pool, metrics)
+
+    outer = await conn.acquire()
+    inner = await conn.acquire()
+
+    assert outer is inner
+    assert metrics.acquires == 1
+
+    await conn.release()
+    assert conn.conn is outer
+    assert metrics.acquired == 1
+
+    await conn.release()
+    assert conn.conn is None
+    assert metrics.acquired == 0
+
+
+@pytest.mark.asyncio
+async def test_query_returns_connection(db_pool: Pool):
+    metrics = PoolMetrics()
+    conn = LazyConnection(db_pool, metrics)
+
+    assert await conn.fetchval("SELECT 1") == 1
+    assert await conn.fetchval("SELECT 2") == 2
+
+    assert conn.conn is None
+    assert metrics.acquires == 2
+    assert metrics.acquired == 0
+
+
+@pytest.mark.asyncio
+async def test_transaction_keeps_connection(db_pool: Pool):
+    metrics = PoolMetrics()
+    conn = LazyConnection(db_pool, metrics)
+    commiter = CommiterImpl(conn, ReplicaConnection(db_pool, PoolMetrics()))
+
+    async with commiter:
+        pid = await conn.fetchval("SELECT pg_backend_pid()")
+        xid = await conn.fetchval("SELECT txid_current()")
+
+        assert await conn.fetchval("SELECT pg_backend_pid()") == pid
+        assert await conn.fetchval("SELECT txid_current()") == xid
+        assert conn.conn is not None
+
+    assert conn.conn is None
+    assert metrics.acquires == 1
+    assert metrics.acquired == 0
+
+
+@pytest.mark.asyncio
+async def test_rollback_releases_connection(db_pool: Pool):
+    metrics = PoolMetrics()
+    conn = LazyConnection(db_pool, metrics)
+    commiter = CommiterImpl(conn, ReplicaConnection(db_pool, PoolMetrics()))
+
+    with pytest.raises(ZeroDivisionError):
+        async with commiter:
+            await conn.execute("CREATE TEMP TABLE rollback_check (id INT)")
+            1 / 0
+
+    assert conn.conn is None
+    assert metrics.acquired == 0
+    assert await conn.fetchval("SELECT to_regclass('pg_temp.rollback_check')") is None
+
+
+@pytest.mark.asyncio
+async def test_read_only_reads_one_replica_snapshot(
+    db_connection: Connection,
+    db_pool: Pool,
+):
+    conn = LazyConnection(db_pool, PoolMetrics())
+    replica = ReplicaConnection(db_pool, PoolMetrics())
+    query = "SELECT count(*) FROM advertisers"
+
+    async with CommiterImpl(conn, replica).read_only():
+        before = await replica.fetchval(query)
+        await db_connection.execute(
+            "INSERT INTO advertisers (advertiser_id, name) VALUES ($1, 'name')",
+            uuid4(),
+        )
+
+        # запись из другого соединения не видна до конца транзакции
+        assert await replica.fetchval(query) == before
+        assert replica.conn is not None
+        assert conn.conn is None
+
+    assert replica.conn is None
+    assert await replica.fetchval(query) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_read_only_rejects_writes(db_pool: Pool):
+    replica = ReplicaConnection(db_pool, PoolMetrics())
+    commiter = CommiterImpl(LazyConnection(db_pool, PoolMetrics()), replica)
+
+    with pytest.raises(ReadOnlySQLTransactionError):
+        async with commiter.read_only():
+            await replica.execute("DELETE FROM advertisers")
+
+    assert replica.conn is None
+
+
+@pytest.mark.asyncio
+async def test_close_releases_held_connection(db_pool: Pool):
+    metrics = PoolMetrics()
+    conn = LazyConnection(db_pool, metrics)
+
+    await conn.acquire()
+    await conn.acquire()
+    await conn.close()
+
+    assert conn.conn is None
+    assert metrics.acquired == 0
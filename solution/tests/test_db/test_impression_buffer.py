@@ -0,0 +1,264 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from asyncpg import Connection, ForeignKeyViolationError, Pool
+
+from ad_platform.application.services.ads import AdsService
+from ad_platform.domain.entities import Impression
+from ad_platform.domain.exceptions import AdWasNotShownBeforeError
+from ad_platform.infrastructure.db.config import ImpressionBufferConfig
+from ad_platform.infrastructure.db.connection import LazyConnection
+from ad_platform.infrastructure.db.gateways.ads import ActionsGatewayImpl
+from ad_platform.infrastructure.db.gateways.campaign import CampaignGatewayImpl
+from ad_platform.infrastructure.db.impressions import ImpressionBuffer
+from ad_platform.infrastructure.db.metrics import PoolMetrics
+
+CLIENTS = 5
+
+
+def make_buffer(pool: Pool, **kwargs: float) -> ImpressionBuffer:
+    config = {
+        "enabled": True,
+        "flush_interval": 10,
+        "batch_size": 1000,
+        "max_size": 1000,
+        "max_retries": 3,
+    }
+    config.update(kwargs)
+
+    return ImpressionBuffer(pool, ImpressionBufferConfig(**config))
+
+
+@pytest_asyncio.fixture
+async def seeded(db_connection: Connection) -> tuple[UUID, list[UUID]]:
+    advertiser_id = uuid4()
+    campaign_id = uuid4()
+    clients = [uuid4() for _ in range(CLIENTS)]
+
+    await db_connection.execute(
+        "INSERT INTO advertisers (advertiser_id, name) VALUES ($1, 'name')",
+        advertiser_id,
+    )
+    await db_connection.executemany(
+        "INSERT INTO clients (client_id, login, age, loc, gender) "
+        "VALUES ($1, 'login', 20, 'Moscow', 'MALE')",
+        [(c,) for c in clients],
+    )
+    await db_connection.execute(
+        """
+        INSERT INTO campaigns (
+            campaign_id, advertiser_id, ad_title, ad_text, impressions_limit,
+            clicks_limit, cost_per_impression, cost_per_click, start_date, end_date, gender
+        ) VALUES ($1, $2, 'title', 'text', 1, 10, 1, 10, 0, 30, 'ALL')
+        """,
+        campaign_id,
+        advertiser_id,
+    )
+
+    return campaign_id, clients
+
+
+def impression(campaign_id: UUID, client_id: UUID) -> Impression:
+    return Impression(campaign_id=campaign_id, client_id=client_id, day=0, price=1)
+
+
+async def count_impressions(conn: Connection, campaign_id: UUID) -> int:
+    return await conn.fetchval(
+        "SELECT count(*) FROM impressions WHERE campaign_id = $1",
+        campaign_id,
+    )
+
+
+async def wait_for_impressions(conn: Connection, campaign_id: UUID, count: int) -> None:
+    for _ in range(50):
+        if await count_impressions(conn, campaign_id) == count:
+            return
+        await asyncio.sleep(0.02)
+
+    pytest.fail(f"expected {count} impressions")
+
+
+@pytest.mark.asyncio
+async def test_flush_on_batch_size(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    buffer = make_buffer(db_pool, batch_size=2)
+    buffer.start()
+
+    await buffer.put(impression(campaign_id, clients[0]))
+    await asyncio.sleep(0.1)
+    assert await count_impressions(db_connection, campaign_id) == 0
+
+    await buffer.put(impression(campaign_id, clients[1]))
+    await wait_for_impressions(db_connection, campaign_id, 2)
+    # счётчики снимаются после коммита, ждём конец фоновой выгрузки
+    async with buffer.flush_lock:
+        assert not buffer.pending_counts
+
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_interval(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    buffer = make_buffer(db_pool, flush_interval=0.05)
+    buffer.start()
+
+    await buffer.put(impression(campaign_id, clients[0]))
+    await wait_for_impressions(db_connection, campaign_id, 1)
+
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_at_max_size(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    # без фоновой задачи очередь освобождает только flush()
+    buffer = make_buffer(db_pool, max_size=2)
+
+    await buffer.put(impression(campaign_id, clients[0]))
+    await buffer.put(impression(campaign_id, clients[1]))
+
+    blocked = asyncio.create_task(buffer.put(impression(campaign_id, clients[2])))
+    await asyncio.sleep(0.1)
+    assert not blocked.done()
+    assert len(buffer.queue) == 2
+
+    await buffer.flush()
+    await asyncio.wait_for(blocked, timeout=1)
+
+    assert len(buffer.queue) == 1
+    assert await count_impressions(db_connection, campaign_id) == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicate_impression_is_buffered_once(
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    buffer = make_buffer(db_pool)
+
+    await buffer.put(impression(campaign_id, clients[0]))
+    await buffer.put(impression(campaign_id, clients[0]))
+
+    assert len(buffer.queue) == 1
+    assert buffer.pending_counts[campaign_id] == 1
+
+
+@pytest.mark.asyncio
+async def test_pending_impressions_count_towards_limit(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    gateway = CampaignGatewayImpl(db_connection)
+    buffer = make_buffer(db_pool)
+
+    async def pick(client_id: UUID) -> object:
+        return await gateway.pick_campaign(
+            client_id,
+            [campaign_id],
+            [1.0],
+            [buffer.pending_counts[campaign_id]],
+        )
+
+    assert await pick(clients[0]) is not None
+
+    # лимит 1 показ (+5%), два показа в буфере его исчерпывают
+    await buffer.put(impression(campaign_id, clients[0]))
+    await buffer.put(impression(campaign_id, clients[1]))
+    assert await count_impressions(db_connection, campaign_id) == 0
+    assert await pick(clients[2]) is None
+
+    await buffer.flush()
+    assert not buffer.pending_counts
+    assert await pick(clients[2]) is None
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    buffer = make_buffer(db_pool)
+    buffer.start()
+
+    for client_id in clients:
+        await buffer.put(impression(campaign_id, client_id))
+
+    await buffer.close()
+
+    assert await count_impressions(db_connection, campaign_id) == CLIENTS
+    assert not buffer.pending
+
+
+@pytest.mark.asyncio
+async def test_failing_impression_is_dropped_after_retries(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    buffer = make_buffer(db_pool, max_retries=2)
+
+    # клиента нет в БД, показ нарушает внешний ключ
+    await buffer.put(impression(campaign_id, uuid4()))
+    for client_id in clients:
+        await buffer.put(impression(campaign_id, client_id))
+
+    with pytest.raises(ForeignKeyViolationError):
+        await buffer.flush()
+    assert len(buffer.queue) == CLIENTS + 1
+
+    await buffer.flush()
+
+    assert not buffer.queue
+    assert not buffer.pending_counts
+    assert await count_impressions(db_connection, campaign_id) == CLIENTS
+
+
+@pytest.mark.asyncio
+async def test_click_flushes_pending_impression(
+    db_connection: Connection,
+    db_pool: Pool,
+    seeded: tuple[UUID, list[UUID]],
+):
+    campaign_id, clients = seeded
+    buffer = make_buffer(db_pool)
+    conn = LazyConnection(db_pool, PoolMetrics())
+    service = AdsService(ActionsGatewayImpl(conn), buffer)
+
+    await buffer.put(impression(campaign_id, clients[0]))
+    assert buffer.is_pending(campaign_id, clients[0])
+
+    await service.click(clients[0], campaign_id, 0)
+
+    assert not buffer.is_pending(campaign_id, clients[0])
+    assert await db_connection.fetchval(
+        "SELECT count(*) FROM clicks WHERE campaign_id = $1 AND client_id = $2",
+        campaign_id,
+        clients[0],
+    ) == 1
+
+    # показа не было ни в буфере, ни в БД
+    with pytest.raises(AdWasNotShownBeforeError):
+        await service.click(clients[1], campaign_id, 0)
+
+    await conn.close()
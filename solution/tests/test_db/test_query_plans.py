@@ -0,0 +1,221 @@
+import json
+from random import Random
+from typing import Any
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from asyncpg import Connection
+
+from ad_platform.domain.entities import DayRange
+from ad_platform.infrastructure.db.gateways.ads import ActionsGatewayImpl
+from ad_platform.infrastructure.db.gateways.stats import StatsGatewayImpl
+from ad_platform.infrastructure.db.gateways.campaign import CampaignGatewayImpl
+
+ADVERTISERS = 100
+CAMPAIGNS_PER_ADVERTISER = 20
+CLIENTS = 10_000
+IMPRESSIONS_PER_CAMPAIGN = 50
+CLICKS_PER_CAMPAIGN = 5
+
+EVENT_TABLES = {"impressions", "clicks"}
+
+
+class ExplainingConnection:
+    def __init__(self, conn: Connection) -> None:
+        self.conn = conn
+        self.plans: list[tuple[str, dict[str, Any]]] = []
+
+    async def explain(self, query: str, args: tuple[Any, ...]) -> None:
+        plan = await self.conn.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+        self.plans.append((query, json.loads(plan)[0]["Plan"]))
+
+    async def fetch(self, query: str, *args: Any) -> Any:
+        await self.explain(query, args)
+        return await self.conn.fetch(query, *args)
+
+    async def fetchrow(self, query: str, *args: Any) -> Any:
+        await self.explain(query, args)
+        return await self.conn.fetchrow(query, *args)
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        await self.explain(query, args)
+        return await self.conn.fetchval(query, *args)
+
+
+def seq_scans(plan: dict[str, Any]) -> list[str]:
+    found = []
+
+    if plan["Node Type"] == "Seq Scan" and plan.get("Relation Name") in EVENT_TABLES:
+        found.append(plan["Relation Name"])
+
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+
+    return found
+
+
+def assert_no_event_seq_scans(conn: ExplainingConnection) -> None:
+    assert conn.plans
+
+    for query, plan in conn.plans:
+        assert not seq_scans(plan), query
+
+
+@pytest_asyncio.fixture
+async def seeded(db_connection: Connection) -> dict[str, Any]:
+    rnd = Random(42)
+
+    advertisers = [uuid4() for _ in range(ADVERTISERS)]
+    clients = [uuid4() for _ in range(CLIENTS)]
+    campaigns = [
+        (uuid4(), advertiser)
+        for advertiser in advertisers
+        for _ in range(CAMPAIGNS_PER_ADVERTISER)
+    ]
+
+    await db_connection.copy_records_to_table(
+        "advertisers",
+        records=[(a, "name") for a in advertisers],
+        columns=["advertiser_id", "name"],
+    )
+    await db_connection.copy_records_to_table(
+        "clients",
+        records=[(c, "login", rnd.randint(1, 80), "Moscow", "MALE") for c in clients],
+        columns=["client_id", "login", "age", "loc", "gender"],
+    )
+    await db_connection.copy_records_to_table(
+        "campaigns",
+        records=[
+            (
+                campaign_id,
+                advertiser_id,
+                "title",
+                "text",
+                1000,
+                100,
+                rnd.random() * 10,
+                rnd.random() * 100,
+                0,
+                30,
+                "ALL",
+            )
+            for campaign_id, advertiser_id in campaigns
+        ],
+        columns=[
+            "campaign_id",
+            "advertiser_id",
+            "ad_title",
+            "ad_text",
+            "impressions_limit",
+            "clicks_limit",
+            "cost_per_impression",
+            "cost_per_click",
+            "start_date",
+            "end_date",
+            "gender",
+        ],
+    )
+    await db_connection.copy_records_to_table(
+        "scores",
+        records=[
+            (rnd.choice(clients), advertiser_id, rnd.randint(0, 100))
+            for advertiser_id in advertisers
+        ],
+        columns=["client_id", "advertiser_id", "score"],
+    )
+
+    impressions = []
+    clicks = []
+    for campaign_id, _ in campaigns:
+        viewers = rnd.sample(clients, IMPRESSIONS_PER_CAMPAIGN)
+        day = rnd.randint(0, 30)
+        impressions.extend((c, campaign_id, day, 1.0) for c in viewers)
+        clicks.extend((c, campaign_id, day, 10.0) for c in viewers[:CLICKS_PER_CAMPAIGN])
+
+    await db_connection.copy_records_to_table(
+        "impressions",
+        records=impressions,
+        columns=["client_id", "campaign_id", "day", "price"],
+    )
+    await db_connection.copy_records_to_table(
+        "clicks",
+        records=clicks,
+        columns=["client_id", "campaign_id", "day", "price"],
+    )
+
+    await db_connection.execute("ANALYZE")
+
+    return {
+        "advertisers": advertisers,
+        "clients": clients,
+        "campaigns": campaigns,
+        "impressions": impressions,
+    }
+
+
+@pytest.mark.asyncio
+async def test_ad_selection_plans(db_connection: Connection, seeded: dict[str, Any]):
+    conn = ExplainingConnection(db_connection)
+    gateway = CampaignGatewayImpl(conn)
+
+    campaign_ids = [campaign_id for campaign_id, _ in seeded["campaigns"][:200]]
+    await gateway.serve_campaign(
+        seeded["clients"][0],
+        0,
+        campaign_ids,
+        [1.0] * len(campaign_ids),
+    )
+    await gateway.pick_campaign(
+        seeded["clients"][0],
+        campaign_ids,
+        [1.0] * len(campaign_ids),
+        [0] * len(campaign_ids),
+    )
+
+    assert_no_event_seq_scans(conn)
+
+
+@pytest.mark.asyncio
+async def test_campaign_listing_plans(db_connection: Connection, seeded: dict[str, Any]):
+    conn = ExplainingConnection(db_connection)
+    gateway = CampaignGatewayImpl(conn)
+
+    await gateway.get_campaigns(seeded["advertisers"][0], 1, 10)
+    await gateway.get_campaigns(
+        seeded["advertisers"][0],
+        0,
+        10,
+        seeded["campaigns"][0][0],
+    )
+
+    assert_no_event_seq_scans(conn)
+
+
+@pytest.mark.asyncio
+async def test_click_lookup_plans(db_connection: Connection, seeded: dict[str, Any]):
+    conn = ExplainingConnection(db_connection)
+    gateway = ActionsGatewayImpl(conn)
+
+    client_id, campaign_id, day, _ = seeded["impressions"][0]
+    await gateway.click(campaign_id, client_id, day)
+
+    assert_no_event_seq_scans(conn)
+
+
+@pytest.mark.asyncio
+async def test_stats_plans(db_connection: Connection, seeded: dict[str, Any]):
+    conn = ExplainingConnection(db_connection)
+    gateway = StatsGatewayImpl(conn)
+
+    campaign_id, advertiser_id = seeded["campaigns"][0]
+    await gateway.get_campaign_stats(campaign_id)
+    await gateway.get_campaigns_stats(
+        [campaign_id for campaign_id, _ in seeded["campaigns"][:100]],
+    )
+    await gateway.get_campaign_daily_stats(campaign_id, DayRange())
+    await gateway.get_campaign_daily_stats(campaign_id, DayRange(from_day=5, to_day=10))
+    await gateway.get_advertiser_stats(advertiser_id)
+    await gateway.get_advertiser_daily_stats(advertiser_id, DayRange(after=5, limit=10))
+
+    assert_no_event_seq_scans(conn)
@@ -0,0 +1,155 @@
+import os
+from dataclasses import replace
+from urllib.parse import urlparse
+from uuid import UUID, uuid4
+
+import pytest
+from asyncpg import Connection, Pool
+from redis.asyncio import Redis
+
+from ad_platform.application.services.campaign_index import CampaignIndex
+from ad_platform.application.services.campaigns import CampaignService
+from ad_platform.domain.entities import Campaign
+from ad_platform.infrastructure.cache.impl import CacheGatewayImpl
+from ad_platform.infrastructure.db.config import DBConfig
+from ad_platform.infrastructure.db.connection import LazyConnection, ReplicaConnection
+from ad_platform.infrastructure.db.di import get_replica_pool, get_replica_pool_metrics
+from ad_platform.infrastructure.db.gateways.campaign import CampaignGatewayImpl
+from ad_platform.infrastructure.db.gateways.stats import StatsGatewayImpl
+from ad_platform.infrastructure.db.metrics import PoolMetrics
+from ad_platform.infrastructure.db.replica import ReplicaRouter
+from ad_platform.infrastructure.storage.config import StorageConfig
+
+
+def db_config(**kwargs) -> DBConfig:
+    dsn = urlparse(os.environ["DATABASE_DSN"])
+    config = DBConfig(
+        host=dsn.hostname,
+        port=dsn.port or 5432,
+        user=dsn.username,
+        password=dsn.password,
+        pool_min_size=1,
+        pool_max_size=2,
+        statement_cache_size=100,
+        command_timeout=None,
+        max_inactive_connection_lifetime=300,
+        replica_host=None,
+        replica_port=dsn.port or 5432,
+        replica_lag=5,
+    )
+
+    return replace(config, **kwargs)
+
+
+# Реплика, до которой ещё не доехали свежие записи
+class LaggingReplica:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_campaigns(self, *args) -> list[Campaign]:
+        self.calls += 1
+        return []
+
+
+@pytest.mark.asyncio
+async def test_router_without_replica_reads_primary(redis: Redis):
+    key = str(uuid4())
+    router = ReplicaRouter(db_config(), CacheGatewayImpl(redis))
+
+    assert await router.use_primary(key)
+
+    await router.mark_written(key)
+    assert await redis.get(f"primary:{key}") is None
+
+
+@pytest.mark.asyncio
+async def test_router_read_your_writes_window(redis: Redis):
+    key = str(uuid4())
+    router = ReplicaRouter(
+        db_config(replica_host="127.0.0.1", replica_lag=5),
+        CacheGatewayImpl(redis),
+    )
+
+    assert not await router.use_primary(key)
+
+    await router.mark_written(key)
+    assert await router.use_primary(key)
+    assert 0 < await redis.ttl(f"primary:{key}") <= 5
+
+    await redis.delete(f"primary:{key}")
+    assert not await router.use_primary(key)
+
+
+@pytest.mark.asyncio
+async def test_campaign_listing_after_create(
+    db_connection: Connection,
+    db_pool: Pool,
+    redis: Redis,
+):
+    advertiser_id = uuid4()
+    campaign_id = uuid4()
+    conn = LazyConnection(db_pool, PoolMetrics())
+    replica = LaggingReplica()
+    router = ReplicaRouter(
+        db_config(replica_host="127.0.0.1"),
+        CacheGatewayImpl(redis),
+    )
+    service = CampaignService(
+        campaign_gateway=CampaignGatewayImpl(conn),
+        campaign_list_gateway=replica,
+        config=StorageConfig(url="", access_key="", secret_key="", cdn="", upload_ttl=0),
+        campaign_index=CampaignIndex(),
+        replica_router=router,
+    )
+
+    await db_connection.execute(
+        "INSERT INTO advertisers (advertiser_id, name) VALUES ($1, 'name')",
+        advertiser_id,
+    )
+    await db_connection.execute(
+        """
+        INSERT INTO campaigns (
+            campaign_id, advertiser_id, ad_title, ad_text, impressions_limit,
+            clicks_limit, cost_per_impression, cost_per_click, start_date, end_date, gender
+        ) VALUES ($1, $2, 'title', 'text', 10, 10, 1, 10, 0, 30, 'ALL')
+        """,
+        campaign_id,
+        advertiser_id,
+    )
+
+    # до отметки о записи список читается с реплики
+    assert await service.get_campaigns(advertiser_id, 0, 10) == []
+    assert replica.calls == 1
+
+    await service.campaigns_changed(advertiser_id)
+
+    campaigns = await service.get_campaigns(advertiser_id, 0, 10)
+    assert [c.campaign_id for c in campaigns] == [campaign_id]
+    assert replica.calls == 1
+
+    await redis.delete(f"primary:{advertiser_id}")
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_replica_pool_and_metrics(db_pool: Pool):
+    metrics = PoolMetrics()
+
+    config = db_config()
+    assert await get_replica_pool(config, db_pool) is db_pool
+    assert get_replica_pool_metrics(config, metrics) is metrics
+
+    config = db_config(replica_host="127.0.0.1")
+    replica_pool = await get_replica_pool(config, db_pool)
+    replica_metrics = get_replica_pool_metrics(config, metrics)
+    assert replica_pool is not db_pool
+    assert replica_metrics is not metrics
+
+    # статистика читается через соединение реплики и учитывается в её метриках
+    gateway = StatsGatewayImpl(ReplicaConnection(replica_pool, replica_metrics))
+    await gateway.get_campaign_stats(UUID(int=0))
+
+    assert replica_metrics.acquires == 1
+    assert metrics.acquires == 0
+
+    await replica_pool.close()
@@ -1,4 +1,6 @@
+from uuid import UUID, uuid4
 from typing import Any
+from asyncpg import Connection
 from httpx import AsyncClient
 import pytest
 
@@ -39,3 +41,175 @@ async def test_click_ad(
         json={"client_id": client_data["client_id"]},
     )
     assert response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_click_ad_outcomes(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    created_active_campaign: dict[str, Any],
+    db_connection: Connection,
+):
+    client_data["age"] = 20
+    other_client = {**client_data, "client_id": str(uuid4())}
+
+    response = await client.post(f"/clients/bulk", json=[client_data, other_client])
+    assert response.status_code == 201
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+
+    ad_id = response.json()["ad_id"]
+
+    for _ in range(2):
+        response = await client.post(
+            f"/ads/{ad_id}/click", json={"client_id": client_data["client_id"]}
+        )
+        assert response.status_code == 204
+
+    clicks = await db_connection.fetchval(
+        "SELECT COUNT(*) FROM clicks WHERE campaign_id = $1 AND client_id = $2",
+        UUID(ad_id),
+        UUID(client_data["client_id"]),
+    )
+    assert clicks == 1
+
+    response = await client.post(
+        f"/ads/{ad_id}/click", json={"client_id": other_client["client_id"]}
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        f"/ads/{ad_id}/click", json={"client_id": str(uuid4())}
+    )
+    assert response.status_code == 404
+
+    response = await client.post(
+        f"/ads/{uuid4()}/click", json={"client_id": client_data["client_id"]}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_ads_skips_deleted_campaign(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    campaign_data: dict[str, Any],
+    created_advertiser: dict[str, Any],
+):
+    client_data["age"] = 20
+    client_data["location"] = str(uuid4())
+    campaign_data["start_date"] = 0
+    campaign_data["cost_per_impression"] = 10**6
+    campaign_data["cost_per_click"] = 10**6
+    campaign_data["targeting"] = {"location": client_data["location"]}
+
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.post(
+        f"/advertisers/{created_advertiser['advertiser_id']}/campaigns",
+        json=campaign_data,
+    )
+    assert response.status_code == 201
+    campaign_id = response.json()["campaign_id"]
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+    assert response.json()["ad_id"] == campaign_id
+
+    response = await client.delete(
+        f"/advertisers/{created_advertiser['advertiser_id']}/campaigns/{campaign_id}"
+    )
+    assert response.status_code == 204
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    if response.status_code == 200:
+        assert response.json()["ad_id"] != campaign_id
+    else:
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_ads_respects_targeting(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    campaign_data: dict[str, Any],
+    created_advertiser: dict[str, Any],
+):
+    client_data["age"] = 20
+    client_data["location"] = str(uuid4())
+    campaign_data["start_date"] = 0
+    campaign_data["cost_per_impression"] = 10**6
+    campaign_data["cost_per_click"] = 10**6
+    campaign_data["targeting"] = {
+        "gender": "FEMALE",
+        "location": client_data["location"],
+    }
+
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.post(
+        f"/advertisers/{created_advertiser['advertiser_id']}/campaigns",
+        json=campaign_data,
+    )
+    assert response.status_code == 201
+    campaign_id = response.json()["campaign_id"]
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    if response.status_code == 200:
+        assert response.json()["ad_id"] != campaign_id
+    else:
+        assert response.status_code == 404
+
+    client_data["gender"] = "FEMALE"
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+    assert response.json()["ad_id"] == campaign_id
+
+
+@pytest.mark.asyncio
+async def test_campaign_counters(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    created_active_campaign: dict[str, Any],
+    db_connection: Connection,
+):
+    client_data["age"] = 20
+
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+    campaign_id = response.json()["ad_id"]
+
+    response = await client.post(
+        f"/ads/{campaign_id}/click", json={"client_id": client_data["client_id"]}
+    )
+    assert response.status_code == 204
+
+    query = """
+        SELECT
+            cnt.impressions_count,
+            cnt.clicks_count,
+            (SELECT COUNT(*) FROM impressions WHERE campaign_id = $1) AS impressions,
+            (SELECT COUNT(*) FROM clicks WHERE campaign_id = $1) AS clicks
+        FROM campaign_counters cnt
+        WHERE cnt.campaign_id = $1
+    """
+
+    counters = await db_connection.fetchrow(query, UUID(campaign_id))
+    assert counters["impressions_count"] == counters["impressions"] > 0
+    assert counters["clicks_count"] == counters["clicks"] > 0
+
+    await db_connection.execute("UPDATE campaign_counters SET impressions_count = 100")
+    await db_connection.execute("SELECT rebuild_counters()")
+
+    counters = await db_connection.fetchrow(query, UUID(campaign_id))
+    assert counters["impressions_count"] == counters["impressions"]
+    assert counters["clicks_count"] == counters["clicks"]
@@ -1,5 +1,6 @@
+import json
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 from asyncpg import Connection
 from httpx import AsyncClient
 import pytest
@@ -115,3 +116,129 @@ async def test_add_score_no_client(
     response = await client.post(f"/ml-scores", json=data)
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_score_max(
+    client: AsyncClient,
+    created_advertiser: dict[str, Any],
+    client_data: dict[str, Any],
+    db_connection: Connection,
+):
+    other_client = {**client_data, "client_id": str(uuid4())}
+    response = await client.post(f"/clients/bulk", json=[client_data, other_client])
+    assert response.status_code == 201
+
+    async def set_score(client_id: str, score: int) -> None:
+        response = await client.post(
+            f"/ml-scores",
+            json={
+                "advertiser_id": created_advertiser["advertiser_id"],
+                "client_id": client_id,
+                "score": score,
+            },
+        )
+        assert response.status_code == 200
+
+    async def get_max() -> int:
+        return await db_connection.fetchval(
+            "SELECT max_score FROM advertiser_score_max WHERE advertiser_id = $1",
+            created_advertiser["advertiser_id"],
+        )
+
+    await set_score(client_data["client_id"], 5)
+    assert await get_max() == 5
+
+    await set_score(other_client["client_id"], 10)
+    assert await get_max() == 10
+
+    await set_score(other_client["client_id"], 3)
+    assert await get_max() == 5
+
+
+@pytest.mark.asyncio
+async def test_add_scores_bulk(
+    client: AsyncClient,
+    created_advertiser: dict[str, Any],
+    created_client: dict[str, Any],
+    db_connection: Connection,
+):
+    data = [
+        {
+            "advertiser_id": created_advertiser["advertiser_id"],
+            "client_id": created_client["client_id"],
+            "score": score,
+        }
+        for score in (1, 7)
+    ]
+
+    response = await client.post(f"/ml-scores/bulk", json=data)
+    assert response.status_code == 200
+    assert response.json() == {"received": 2, "upserted": 1}
+
+    response = await client.post(
+        f"/ml-scores/bulk",
+        content="\n".join(json.dumps({**x, "score": 9}) for x in data) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"received": 2, "upserted": 1}
+
+    score = await db_connection.fetchval(
+        "SELECT score FROM scores WHERE advertiser_id = $1 AND client_id = $2",
+        UUID(created_advertiser["advertiser_id"]),
+        UUID(created_client["client_id"]),
+    )
+    assert score == 9
+
+    missing = str(uuid4())
+    response = await client.post(
+        f"/ml-scores/bulk",
+        json=[{**data[0], "score": 3}, {**data[0], "client_id": missing}],
+    )
+    assert response.status_code == 404
+    assert missing in response.json()["detail"]
+
+    response = await client.post(
+        f"/ml-scores/bulk",
+        content='{"client_id": "invalid"}\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 400
+
+    score = await db_connection.fetchval(
+        "SELECT score FROM scores WHERE advertiser_id = $1 AND client_id = $2",
+        UUID(created_advertiser["advertiser_id"]),
+        UUID(created_client["client_id"]),
+    )
+    assert score == 9
+
+    # промежуточные пачки удаляются и после успешных, и после отклонённых загрузок
+    assert not await db_connection.fetchval("SELECT count(*) FROM scores_uploads")
+
+
+@pytest.mark.asyncio
+async def test_add_advertisers_stream(
+    client: AsyncClient,
+    db_connection: Connection,
+):
+    advertisers = [{"advertiser_id": str(uuid4()), "name": f"name {i}"} for i in range(3)]
+
+    response = await client.post(
+        f"/advertisers/bulk/stream",
+        content="\n".join(json.dumps(x) for x in advertisers) + "\n{}\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 201
+
+    summary = response.json()
+    assert summary["received"] == 4
+    assert summary["upserted"] == 3
+    assert summary["failed"] == 1
+    assert summary["errors"][0]["line"] == 4
+
+    count = await db_connection.fetchval(
+        "SELECT COUNT(*) FROM advertisers WHERE advertiser_id = ANY($1::uuid[])",
+        [UUID(x["advertiser_id"]) for x in advertisers],
+    )
+    assert count == 3
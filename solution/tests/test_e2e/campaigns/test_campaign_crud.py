@@ -52,6 +52,38 @@ async def test_create_campaign(
     assert response.json()["advertiser_id"] == created_advertiser["advertiser_id"]
 
 
+@pytest.mark.asyncio
+async def test_get_campaigns_cursor(
+    client: AsyncClient,
+    created_advertiser: dict[str, Any],
+    db_connection: Connection,
+    campaign_data: dict[str, Any],
+):
+    url = f"/advertisers/{created_advertiser['advertiser_id']}/campaigns"
+
+    created = []
+    for _ in range(5):
+        response = await client.post(url, json=campaign_data)
+        assert response.status_code == 201
+        created.append(response.json()["campaign_id"])
+
+    seen = []
+    params = {"size": 2}
+    while True:
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+        seen.extend(c["campaign_id"] for c in response.json())
+
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["after"] = response.headers["X-Next-Cursor"]
+
+    assert seen == sorted(created)
+
+    response = await client.get(url, params={"after": "invalid"})
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_update_campaign(
     client: AsyncClient, created_campaign: dict[str, Any], campaign_data: dict[str, Any]
@@ -113,6 +145,7 @@ async def test_add_image_campaign(
     client: AsyncClient,
     created_campaign: dict[str, Any],
     created_advertiser: dict[str, Any],
+    db_connection: Connection,
     file_valid,
 ):
     response = await client.post(
@@ -123,6 +156,9 @@ async def test_add_image_campaign(
     print(response.json())
     assert response.status_code == 200
 
+    # привязанное изображение не должно попасть под очистку
+    assert not await db_connection.fetchval("SELECT count(*) FROM image_uploads")
+
     response = await client.get(
         f"/advertisers/{created_advertiser['advertiser_id']}/campaigns/{created_campaign['campaign_id']}"
     )
@@ -1,4 +1,6 @@
+import json
 from typing import Any
+from uuid import UUID, uuid4
 from asyncpg import Connection
 from httpx import AsyncClient
 import pytest
@@ -50,3 +52,84 @@ async def test_get_client(client: AsyncClient, created_client: dict[str, Any]):
 
     assert response.status_code == 200
     assert response.json() == created_client
+
+
+@pytest.mark.asyncio
+async def test_get_client_after_update(
+    client: AsyncClient, created_client: dict[str, Any]
+):
+    response = await client.get(f"/clients/{created_client['client_id']}")
+    assert response.json() == created_client
+
+    before = (await client.get("/metrics")).json()["client_cache"]
+
+    response = await client.get(f"/clients/{created_client['client_id']}")
+    assert response.json() == created_client
+
+    after = (await client.get("/metrics")).json()["client_cache"]
+    assert after["hits"] == before["hits"] + 1
+
+    created_client["age"] = created_client["age"] + 1
+    response = await client.post("/clients/bulk", json=[created_client])
+    assert response.status_code == 201
+
+    response = await client.get(f"/clients/{created_client['client_id']}")
+    assert response.json() == created_client
+
+
+@pytest.mark.asyncio
+async def test_add_clients_stream(
+    client: AsyncClient, client_data: dict[str, Any], db_connection: Connection
+):
+    other_client = {**client_data, "client_id": str(uuid4()), "login": "other"}
+    lines = [
+        json.dumps(client_data),
+        "",
+        json.dumps({**client_data, "age": "invalid"}),
+        json.dumps(other_client),
+    ]
+
+    response = await client.post(
+        f"/clients/bulk/stream",
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 201
+
+    summary = response.json()
+    assert summary["received"] == 3
+    assert summary["upserted"] == 2
+    assert summary["failed"] == 1
+    assert [e["line"] for e in summary["errors"]] == [3]
+
+    logins = await db_connection.fetch(
+        "SELECT login FROM clients WHERE client_id = ANY($1::uuid[]) ORDER BY login",
+        [UUID(client_data["client_id"]), UUID(other_client["client_id"])],
+    )
+    assert [r["login"] for r in logins] == ["login", "other"]
+
+
+@pytest.mark.asyncio
+async def test_add_clients_copy(
+    client: AsyncClient, client_data: dict[str, Any], db_connection: Connection
+):
+    clients = [{**client_data, "client_id": str(uuid4())} for _ in range(1500)]
+    clients.append({**clients[0], "login": "last"})
+
+    response = await client.post(f"/clients/bulk", json=clients)
+    assert response.status_code == 201
+    assert len(response.json()) == len(clients)
+
+    count = await db_connection.fetchval(
+        "SELECT COUNT(*) FROM clients WHERE client_id = ANY($1::uuid[])",
+        [UUID(x["client_id"]) for x in clients],
+    )
+    assert count == 1500
+
+    login = await db_connection.fetchval(
+        "SELECT login FROM clients WHERE client_id = $1", UUID(clients[0]["client_id"])
+    )
+    assert login == "last"
+
+    response = await client.get(f"/clients/{clients[0]['client_id']}")
+    assert response.json()["login"] == "last"
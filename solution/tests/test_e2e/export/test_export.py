@@ -0,0 +1,59 @@
+import csv
+import json
+from typing import Any
+from uuid import uuid4
+
+from asyncpg import Connection
+from httpx import AsyncClient
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_export_events(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    created_active_campaign: dict[str, Any],
+    db_connection: Connection,
+):
+    client_data["age"] = 20
+
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+
+    ad_id = response.json()["ad_id"]
+    advertiser_id = response.json()["advertiser_id"]
+
+    response = await client.post(
+        f"/ads/{ad_id}/click", json={"client_id": client_data["client_id"]}
+    )
+    assert response.status_code == 204
+
+    url = f"/export/advertisers/{advertiser_id}/events"
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(e["event"] for e in events) == ["click", "impression"]
+    assert all(e["campaign_id"] == ad_id for e in events)
+    assert all(e["client_id"] == client_data["client_id"] for e in events)
+
+    response = await client.get(url, params={"format": "csv", "campaign_id": ad_id})
+    assert response.status_code == 200
+
+    rows = list(csv.DictReader(response.text.splitlines()))
+    assert sorted(r["event"] for r in rows) == ["click", "impression"]
+
+    response = await client.get(url, params={"from_day": 1})
+    assert response.status_code == 200
+    assert response.text == ""
+
+    response = await client.get(url, params={"campaign_id": str(uuid4())})
+    assert response.status_code == 404
+
+    response = await client.get(f"/export/advertisers/{uuid4()}/events")
+    assert response.status_code == 404
@@ -1,4 +1,5 @@
 from typing import Any
+from uuid import UUID, uuid4
 from asyncpg import Connection
 from httpx import AsyncClient
 import pytest
@@ -49,3 +50,111 @@ async def test_get_campaign_stats(
             END LOOP;
         END $$;""",
     )
+
+
+@pytest.mark.asyncio
+async def test_get_daily_stats(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    created_active_campaign: dict[str, Any],
+    db_connection: Connection,
+):
+    client_data["age"] = 20
+
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+
+    ad_id = response.json()["ad_id"]
+    advertiser_id = response.json()["advertiser_id"]
+
+    response = await client.post(
+        f"/ads/{ad_id}/click", json={"client_id": client_data["client_id"]}
+    )
+    assert response.status_code == 204
+
+    response = await client.get(f"/stats/campaigns/{ad_id}/daily")
+    assert response.status_code == 200
+
+    daily = response.json()
+    assert len(daily) == 1
+    assert daily[0]["impressions_count"] == 1
+    assert daily[0]["clicks_count"] == 1
+    assert daily[0]["conversion"] == 1
+
+    response = await client.get(f"/stats/advertisers/{advertiser_id}/daily")
+    assert response.status_code == 200
+    assert response.json() == daily
+
+    await db_connection.execute("UPDATE campaign_daily_stats SET clicks_count = 100")
+    await db_connection.execute("SELECT rebuild_counters()")
+
+    response = await client.get(f"/stats/campaigns/{ad_id}/daily")
+    assert response.json() == daily
+
+    response = await client.get(f"/stats/advertisers/{advertiser_id}/campaigns")
+    assert response.status_code == 200
+    assert response.json()["impressions_count"] == 1
+    assert response.json()["clicks_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_campaigns_stats_bulk(
+    client: AsyncClient,
+    client_data: dict[str, Any],
+    created_active_campaign: dict[str, Any],
+    db_connection: Connection,
+):
+    client_data["age"] = 20
+
+    response = await client.post(f"/clients/bulk", json=[client_data])
+    assert response.status_code == 201
+
+    response = await client.get(f"/ads", params={"client_id": client_data["client_id"]})
+    assert response.status_code == 200
+
+    ad_id = response.json()["ad_id"]
+
+    response = await client.get(f"/stats/campaigns/{ad_id}")
+    assert response.status_code == 200
+    single = response.json()
+
+    response = await client.post(f"/stats/campaigns/bulk", json=[ad_id, ad_id])
+    assert response.status_code == 200
+    assert response.json() == [{"campaign_id": ad_id, **single}]
+
+    response = await client.post(f"/stats/campaigns/bulk", json=[ad_id, str(uuid4())])
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_daily_stats_range(
+    client: AsyncClient,
+    created_active_campaign: dict[str, Any],
+    db_connection: Connection,
+):
+    campaign_id = created_active_campaign["campaign_id"]
+    advertiser_id = created_active_campaign["advertiser_id"]
+
+    await db_connection.executemany(
+        """INSERT INTO campaign_daily_stats (campaign_id, day, impressions_count)
+        VALUES ($1, $2, 1)""",
+        [(UUID(campaign_id), day) for day in range(5)],
+    )
+
+    for url in (
+        f"/stats/campaigns/{campaign_id}/daily",
+        f"/stats/advertisers/{advertiser_id}/daily",
+    ):
+        response = await client.get(url, params={"from_day": 1, "to_day": 3})
+        assert response.status_code == 200
+        assert [x["date"] for x in response.json()] == [1, 2, 3]
+
+        response = await client.get(url, params={"after": 1, "limit": 2})
+        assert response.status_code == 200
+        assert [x["date"] for x in response.json()] == [2, 3]
+
+        response = await client.get(url, params={"limit": 0})
+        assert response.status_code == 400